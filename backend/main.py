@@ -1 +1,130 @@
+# backend/main.py
+from __future__ import annotations
 
+import json
+import tempfile
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import PlainTextResponse, StreamingResponse
+
+from backend.providers import metrics
+from backend.providers.batch import parse_rows
+from backend.providers.free_civic import (
+    CivicLookupError,
+    Official,
+    UpstreamUnavailable,
+    get_district_officials,
+    get_federal_officials,
+    get_federal_officials_batch,
+    lifespan,
+    reverse_geocode,
+)
+
+app = FastAPI(title="EagleReach API", lifespan=lifespan)
+
+
+@app.get("/health")
+async def health() -> dict:
+    return {"status": "ok"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics() -> PlainTextResponse:
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
+def _official_view(o: Official) -> Dict[str, Any]:
+    """The Official fields plus the single-valued ones the frontend reads."""
+    view = jsonable_encoder(o)
+    view["photo"] = o.photo_url
+    view["website"] = o.urls[0] if o.urls else None
+    view["phone"] = o.phones[0] if o.phones else None
+    return view
+
+
+@app.get("/officials")
+async def officials(
+    zip: Optional[str] = Query(None, pattern=r"^\d{5}$"),
+    state: Optional[str] = Query(None, pattern=r"^[A-Za-z]{2}$"),
+    district: Optional[int] = Query(None, ge=0, le=99),
+) -> dict:
+    """
+    Federal officials for a ZIP, or for a state + district (as returned by
+    /revgeo, which has no ZIP). Split ZIPs list every representative.
+    """
+    try:
+        if zip is not None:
+            found: List[Official] = await get_federal_officials(zip)
+        elif state is not None and district is not None:
+            found = await get_district_officials(state, district)
+        else:
+            raise HTTPException(status_code=422, detail="pass zip, or state and district")
+    except UpstreamUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except CivicLookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    senators = [_official_view(o) for o in found if o.office == "US Senator"]
+    reps = [_official_view(o) for o in found if o.office != "US Senator"]
+    # a split ZIP has several; "district" is the first, like "representative"
+    districts = [int(r["district"]) for r in reps if (r["district"] or "").isdigit()]
+    return {
+        "location": {
+            "zip": zip,
+            "state": (state.upper() if state else None) or (found[0].state if found else None),
+            "district": district if district is not None else (districts[0] if districts else None),
+            "districts": [district] if district is not None else districts,
+        },
+        "officials": {
+            "senators": senators,
+            "representatives": reps,
+            "representative": reps[0] if reps else None,
+        },
+    }
+
+
+@app.get("/revgeo")
+async def revgeo(
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+) -> dict:
+    """
+    (state, district) for a coordinate. There is no ZIP in the answer;
+    pass state and district to /officials instead.
+    """
+    try:
+        state, district = await reverse_geocode(lat, lon)
+    except UpstreamUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except CivicLookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return {"lat": lat, "lon": lon, "state": state, "district": district}
+
+
+@app.post("/officials/batch")
+async def officials_batch(request: Request, format: Optional[str] = None) -> StreamingResponse:
+    """
+    Body is a raw CSV or JSONL upload (format=csv|jsonl, else guessed from
+    Content-Type). Streams one NDJSON line per input row as chunks finish.
+    """
+    fmt = format or ("jsonl" if "json" in request.headers.get("content-type", "") else "csv")
+    if fmt not in ("csv", "jsonl"):
+        raise HTTPException(status_code=400, detail="format must be csv or jsonl")
+
+    # Spool the upload first: the streaming response listens for client
+    # disconnects on the same receive channel the body arrives on.
+    spool = tempfile.SpooledTemporaryFile(max_size=1 << 20)
+    async for chunk in request.stream():
+        spool.write(chunk)
+    spool.seek(0)
+
+    async def lines() -> AsyncIterator[bytes]:
+        try:
+            async for result in get_federal_officials_batch(parse_rows(spool, fmt)):
+                yield (json.dumps(jsonable_encoder(result)) + "\n").encode()
+        finally:
+            spool.close()
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
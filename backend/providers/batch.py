@@ -0,0 +1,145 @@
+# backend/providers/batch.py
+"""
+Input parsing and the Census batch geocoder for bulk officials lookups.
+
+Uploads are CSV (header row; either an `address` column or
+street/city/state/zip columns, plus an optional `id`) or JSONL with the
+same keys. Both are read record by record from the spooled upload, so
+nothing holds the whole of it in memory; a quoted CSV field may span
+lines. A record that cannot be parsed becomes a row carrying an "error"
+instead of ending the stream.
+"""
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+from typing import IO, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import httpx
+
+from .clients import pool
+from .resilience import DEADLINES, guarded
+
+CENSUS_BATCH_URL = (
+    "https://geocoding.geo.census.gov/geocoder/geographies/addressbatch"
+)
+BATCH_CHUNK_SIZE = int(os.getenv("EAGLEREACH_BATCH_CHUNK", "1000"))  # Census max is 10,000
+BATCH_CONCURRENCY = int(os.getenv("EAGLEREACH_BATCH_CONCURRENCY", "4"))
+BATCH_TIMEOUT = DEADLINES["census_batch"]
+# per-row Census fallbacks in flight per job; keep well under the census pool
+BATCH_FALLBACK_CONCURRENCY = int(os.getenv("EAGLEREACH_BATCH_FALLBACK_CONCURRENCY", "8"))
+
+Row = Dict[str, str]
+
+
+def _row_from(fields: Dict[str, object], n: int) -> Row:
+    r = {str(k).strip().lower(): ("" if v is None else str(v).strip()) for k, v in fields.items()}
+    if not r.get("address"):
+        parts = [r.get("street"), r.get("city"), r.get("state"), r.get("zip")]
+        r["address"] = ", ".join(p for p in parts if p)
+    r.setdefault("id", "")
+    r["id"] = r["id"] or str(n)
+    return r
+
+
+def _jsonl_fields(line: str) -> Dict[str, object]:
+    value = json.loads(line)
+    if isinstance(value, str):
+        return {"address": value}
+    if not isinstance(value, dict):
+        raise ValueError(f"expected a JSON object or string, got {type(value).__name__}")
+    return value
+
+
+def _records(text: IO[str], fmt: str) -> Iterator[Union[Dict[str, object], Exception]]:
+    """Field dicts, or the parse error for a record that could not be read."""
+    if fmt == "jsonl":
+        for line in text:
+            if line.strip():
+                try:
+                    yield _jsonl_fields(line)
+                except ValueError as e:
+                    yield e
+        return
+
+    # one csv.reader over the whole upload, so quoted newlines stay in their field
+    reader = csv.reader(text)
+    header: Optional[List[str]] = None
+    while True:
+        try:
+            values = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            yield e
+            continue
+        if not any(v.strip() for v in values):
+            continue
+        if header is None:
+            header = values
+        else:
+            yield dict(zip(header, values))
+
+
+async def parse_rows(upload: IO[bytes], fmt: str) -> AsyncIterator[Row]:
+    """
+    Rows from a CSV or JSONL upload; ids default to the 1-based row
+    number. Unparseable records yield {"id", "address": "", "error"}.
+    """
+    text = io.TextIOWrapper(upload, encoding="utf-8-sig", errors="replace", newline="")
+    try:
+        for n, fields in enumerate(_records(text, fmt), 1):
+            if isinstance(fields, Exception):
+                yield {"id": str(n), "address": "", "error": f"Unreadable row: {fields}"}
+            else:
+                yield _row_from(fields, n)
+    finally:
+        text.detach()  # the caller owns the upload
+
+
+def _census_csv(rows: Sequence[Row]) -> bytes:
+    """Census batch input: Unique ID, Street address, City, State, ZIP."""
+    out = io.StringIO()
+    w = csv.writer(out)
+    for i, r in enumerate(rows):
+        if r.get("street"):
+            w.writerow([i, r["street"], r.get("city", ""), r.get("state", ""), r.get("zip", "")])
+        else:
+            w.writerow([i, r["address"], "", "", ""])
+    return out.getvalue().encode()
+
+
+async def census_batch(
+    rows: Sequence[Row], benchmark: str = "Public_AR_Current"
+) -> Dict[int, Tuple[float, float]]:
+    """
+    Geocode up to 10,000 rows in one Census request. Returns index → (lat, lon)
+    for matched rows. The batch 'geographies' output stops at
+    state/county/tract/block, so districts are resolved from the
+    coordinates by the caller. Runs under its own breaker and deadline
+    (EAGLEREACH_BATCH_TIMEOUT), separate from single lookups.
+    """
+    async def call() -> httpx.Response:
+        r = await pool.client("census").post(
+            CENSUS_BATCH_URL,
+            data={"benchmark": benchmark, "vintage": "Current_Current"},
+            files={"addressFile": ("batch.csv", _census_csv(rows), "text/csv")},
+            timeout=BATCH_TIMEOUT,
+        )
+        r.raise_for_status()
+        return r
+
+    r = await guarded("census_batch", call)
+    found: Dict[int, Tuple[float, float]] = {}
+    for rec in csv.reader(io.StringIO(r.text)):
+        # id, input, Match|No_Match|Tie, type, matched address, "lon,lat", ...
+        if len(rec) < 6 or rec[2] != "Match" or not rec[0].isdigit():
+            continue
+        lon, _, lat = rec[5].partition(",")
+        try:
+            found[int(rec[0])] = (float(lat), float(lon))
+        except ValueError:
+            continue
+    return found
@@ -0,0 +1,174 @@
+# backend/providers/cache.py
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+from .models import CivicLookupError, UpstreamUnavailable
+
+log = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+_SPACES = re.compile(r"\s+")
+_COMMA = re.compile(r"\s*,\s*")
+_TRAILING_DOT = re.compile(r"\.(?=[\s,]|$)")
+
+
+def normalize_key(address: str) -> str:
+    """Cache key for a user query: case, spacing and trailing dots don't matter."""
+    key = _TRAILING_DOT.sub("", address.strip().lower())
+    key = _SPACES.sub(" ", key)
+    return _COMMA.sub(", ", key).strip(" ,")
+
+
+class _Entry(Generic[V]):
+    __slots__ = ("stored", "value", "error")
+
+    def __init__(self, value: Optional[V], error: Optional[CivicLookupError]) -> None:
+        self.stored = time.monotonic()
+        self.value = value
+        self.error = error
+
+
+class LookupCache(Generic[V]):
+    """
+    Bounded LRU in front of an async loader:
+      - entries are fresh for `ttl`, then served stale for `stale_ttl` more
+        while one background refresh runs
+      - CivicLookupError results are remembered for `negative_ttl`
+      - concurrent misses for the same key share one in-flight load
+      - if a reload fails with UpstreamUnavailable, an expired answer is
+        served rather than an error
+    Other exceptions (network errors etc.) are never cached.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        ttl: float = 60 * 60,
+        stale_ttl: float = 10 * 60,
+        negative_ttl: float = 60,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+        self._data: "OrderedDict[str, _Entry[V]]" = OrderedDict()
+        self._inflight: Dict[str, "asyncio.Future[V]"] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "inflight": len(self._inflight),
+        }
+
+    def _lookup(self, key: str) -> Tuple[Optional[_Entry[V]], bool, Optional[_Entry[V]]]:
+        """
+        (entry, is_stale, expired). Expired answers stay in the LRU as a
+        last resort during outages until a reload replaces them; expired
+        errors are dropped.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None, False, None
+        age = time.monotonic() - entry.stored
+        if entry.error is not None:
+            if age < self.negative_ttl:
+                return entry, False, None
+            del self._data[key]
+            self.expirations += 1
+            return None, False, None
+        if age < self.ttl:
+            return entry, False, None
+        if age < self.ttl + self.stale_ttl:
+            return entry, True, None
+        self.expirations += 1
+        return None, False, entry
+
+    def _store(self, key: str, entry: _Entry[V]) -> None:
+        self._data[key] = entry
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[V]]) -> V:
+        try:
+            value = await loader()
+        except UpstreamUnavailable:
+            # an outage, not an answer about this key
+            raise
+        except CivicLookupError as e:
+            self._store(key, _Entry(None, e))
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        self._store(key, _Entry(value, None))
+        return value
+
+    def _start(self, key: str, loader: Callable[[], Awaitable[V]]) -> "asyncio.Future[V]":
+        fut = self._inflight.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(self._load(key, loader))
+            self._inflight[key] = fut
+        else:
+            self.coalesced += 1
+        return fut
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[V]]) -> V:
+        entry, stale, expired = self._lookup(key)
+        if entry is not None:
+            self._data.move_to_end(key)
+            if entry.error is not None:
+                self.negative_hits += 1
+                raise CivicLookupError(str(entry.error))
+            if stale:
+                self.stale_hits += 1
+                if key not in self._inflight:
+                    fut = self._start(key, loader)
+                    # stale-while-revalidate: nobody awaits this one
+                    fut.add_done_callback(_log_refresh_failure)
+            else:
+                self.hits += 1
+            return entry.value  # type: ignore[return-value]
+
+        self.misses += 1
+        try:
+            # shield: one caller giving up must not cancel the shared load
+            return await asyncio.shield(self._start(key, loader))
+        except UpstreamUnavailable:
+            if expired is None:
+                raise
+            self.stale_hits += 1
+            return expired.value  # type: ignore[return-value]
+
+
+def _log_refresh_failure(fut: "asyncio.Future") -> None:
+    if not fut.cancelled() and fut.exception() is not None:
+        log.warning("background cache refresh failed: %s", fut.exception())
@@ -0,0 +1,130 @@
+# backend/providers/clients.py
+from __future__ import annotations
+
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import httpx
+
+from .metrics import UPSTREAM_REQUESTS, UPSTREAM_SECONDS
+
+log = logging.getLogger(__name__)
+
+
+# ----------------------------
+# Upstream settings
+# ----------------------------
+@dataclass(frozen=True)
+class Upstream:
+    timeout: float
+    max_connections: int
+    max_keepalive: int
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.getenv(name, str(default)))
+
+
+def _upstream(key: str, timeout: float) -> Upstream:
+    """Per-upstream knobs, e.g. EAGLEREACH_CENSUS_TIMEOUT / _MAX_CONNECTIONS / _KEEPALIVE."""
+    prefix = f"EAGLEREACH_{key.upper()}"
+    return Upstream(
+        timeout=_env_float(f"{prefix}_TIMEOUT", timeout),
+        max_connections=_env_int(f"{prefix}_MAX_CONNECTIONS", 20),
+        max_keepalive=_env_int(f"{prefix}_KEEPALIVE", 10),
+    )
+
+
+# One client (and so one connection pool) per upstream host. `timeout` is
+# also the per-call deadline resilience.guarded() enforces.
+UPSTREAMS: Dict[str, Upstream] = {
+    "census": _upstream("census", 6),            # geocoding.geo.census.gov
+    "zippopotam": _upstream("zippopotam", 3),    # api.zippopotam.us
+    "legislators": _upstream("legislators", 30), # unitedstates.github.io
+}
+KEEPALIVE_EXPIRY = _env_float("EAGLEREACH_HTTP_KEEPALIVE_EXPIRY", 30)
+HTTP2 = os.getenv("EAGLEREACH_HTTP2", "0").lower() in ("1", "true", "yes")
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """Counts upstream requests by host/status and times them to response headers."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport) -> None:
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        t0 = time.perf_counter()
+        try:
+            response = await self.inner.handle_async_request(request)
+        except BaseException as e:
+            UPSTREAM_REQUESTS.inc(host=host, status=type(e).__name__)
+            raise
+        finally:
+            UPSTREAM_SECONDS.observe(time.perf_counter() - t0, host=host)
+        UPSTREAM_REQUESTS.inc(host=host, status=str(response.status_code))
+        return response
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+class ClientPool:
+    """
+    Long-lived httpx clients shared by all requests, one per upstream so
+    each host gets its own connection limits and timeout. Clients are
+    created on first use and closed together by aclose().
+    """
+
+    def __init__(
+        self,
+        upstreams: Optional[Dict[str, Upstream]] = None,
+        http2: bool = HTTP2,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.upstreams = dict(upstreams or UPSTREAMS)
+        if http2 and not _http2_available():
+            log.warning("EAGLEREACH_HTTP2 set but the 'h2' package is missing; using HTTP/1.1")
+            http2 = False
+        self.http2 = http2
+        self.transport = transport  # tests/benchmarks inject a MockTransport here
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def client(self, name: str) -> httpx.AsyncClient:
+        c = self._clients.get(name)
+        if c is None or c.is_closed:
+            cfg = self.upstreams[name]
+            inner = self.transport or httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=cfg.max_connections,
+                    max_keepalive_connections=cfg.max_keepalive,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                ),
+                http2=self.http2,
+            )
+            c = httpx.AsyncClient(timeout=cfg.timeout, transport=InstrumentedTransport(inner))
+            self._clients[name] = c
+        return c
+
+    async def aclose(self) -> None:
+        clients, self._clients = self._clients, {}
+        for c in clients.values():
+            await c.aclose()
+
+
+pool = ClientPool()
@@ -0,0 +1,170 @@
+# backend/providers/crosswalk.py
+"""
+Offline ZIP/ZCTA → congressional district crosswalk.
+
+The table is built once from a CSV with columns
+    zcta, state_abbr, cd[, share]
+(e.g. the widely used zccd.csv; extra columns are ignored) into a small
+binary file that is memory-mapped at startup:
+
+    header   magic "ZCD1", n_zips, n_rows          (little-endian uint32)
+    zips     uint32[n_zips]      sorted ZIPs as integers
+    offsets  uint32[n_zips + 1]  row range for each ZIP
+    rows     uint32[n_rows]      state_idx << 24 | district << 16 | share
+
+`share` is the fraction of the ZIP in that district scaled to 0..65535.
+When the CSV has no share column, each district of a ZIP gets an equal
+share.
+
+Build:  python -m backend.providers.crosswalk zccd.csv backend/data/zip_cd.bin
+"""
+from __future__ import annotations
+
+import csv
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+MAGIC = b"ZCD1"
+_HEADER = struct.Struct("<4sII")
+DEFAULT_PATH = os.getenv(
+    "EAGLEREACH_ZIP_TABLE",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "zip_cd.bin"),
+)
+
+# Index → USPS abbreviation. Append only; the index is stored in the table.
+STATES: Tuple[str, ...] = (
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "DC", "FL", "GA", "HI",
+    "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN",
+    "MS", "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH",
+    "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA",
+    "WV", "WI", "WY", "AS", "GU", "MP", "PR", "VI",
+)
+_STATE_INDEX = {s: i for i, s in enumerate(STATES)}
+
+# (state_abbr, district, share 0..1)
+ZipDistrict = Tuple[str, int, float]
+
+
+def _u32(buf: memoryview) -> Sequence[int]:
+    """View little-endian uint32 data without copying (copy on big-endian hosts)."""
+    if sys.byteorder == "little":
+        return buf.cast("I")
+    a = array("I", buf.tobytes())
+    a.byteswap()
+    return a
+
+
+class ZipCrosswalk:
+    """Read-only view over a built crosswalk table."""
+
+    def __init__(self, data: memoryview, mm: Optional[mmap.mmap] = None) -> None:
+        magic, n_zips, n_rows = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("not a ZIP crosswalk table")
+        pos = _HEADER.size
+        self._zips = _u32(data[pos:pos + 4 * n_zips])
+        pos += 4 * n_zips
+        self._offsets = _u32(data[pos:pos + 4 * (n_zips + 1)])
+        pos += 4 * (n_zips + 1)
+        self._rows = _u32(data[pos:pos + 4 * n_rows])
+        self._mm = mm
+
+    @classmethod
+    def open(cls, path: str = DEFAULT_PATH) -> "ZipCrosswalk":
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(memoryview(mm), mm)
+
+    def __len__(self) -> int:
+        return len(self._zips)
+
+    def __contains__(self, zip_code: str) -> bool:
+        return bool(self.lookup(zip_code))
+
+    def lookup(self, zip_code: str) -> List[ZipDistrict]:
+        """Districts overlapping a ZIP, largest share first; [] if unknown."""
+        if not (zip_code.isdigit() and len(zip_code) == 5):
+            return []
+        key = int(zip_code)
+        i = bisect_left(self._zips, key)
+        if i == len(self._zips) or self._zips[i] != key:
+            return []
+        out: List[ZipDistrict] = []
+        for j in range(self._offsets[i], self._offsets[i + 1]):
+            row = self._rows[j]
+            out.append((STATES[row >> 24], (row >> 16) & 0xFF, (row & 0xFFFF) / 0xFFFF))
+        return out
+
+
+def build(rows: Sequence[Tuple[str, str, int, Optional[float]]]) -> bytes:
+    """Serialize (zcta, state_abbr, district, share|None) rows into a table."""
+    by_zip: Dict[int, Dict[Tuple[int, int], Optional[float]]] = {}
+    for zcta, state, district, share in rows:
+        key = (_STATE_INDEX[state], int(district))
+        by_zip.setdefault(int(zcta), {})[key] = share
+
+    zips = array("I")
+    offsets = array("I", [0])
+    packed = array("I")
+    for z in sorted(by_zip):
+        parts = by_zip[z]
+        if any(s is None for s in parts.values()):
+            parts = {k: 1.0 / len(parts) for k in parts}
+        total = sum(parts.values()) or 1.0
+        for (si, d), s in sorted(parts.items(), key=lambda kv: -(kv[1] or 0)):
+            share = round(min(1.0, (s or 0) / total) * 0xFFFF)
+            packed.append(si << 24 | (d & 0xFF) << 16 | share)
+        zips.append(z)
+        offsets.append(len(packed))
+
+    if sys.byteorder != "little":
+        for a in (zips, offsets, packed):
+            a.byteswap()
+    return (
+        _HEADER.pack(MAGIC, len(zips), len(packed))
+        + zips.tobytes() + offsets.tobytes() + packed.tobytes()
+    )
+
+
+def read_csv(path: str) -> List[Tuple[str, str, int, Optional[float]]]:
+    rows: List[Tuple[str, str, int, Optional[float]]] = []
+    with open(path, newline="") as f:
+        for r in csv.DictReader(f):
+            state = (r.get("state_abbr") or "").strip().upper()
+            zcta = (r.get("zcta") or r.get("zip") or "").strip()
+            if state not in _STATE_INDEX or not zcta.isdigit():
+                continue
+            cd = (r.get("cd") or r.get("district") or "0").strip()
+            share = r.get("share")
+            # at-large seats show up as 0 or 98 depending on the source
+            district = int(cd) if cd.isdigit() and int(cd) < 98 else 0
+            rows.append((zcta.zfill(5), state, district, float(share) if share else None))
+    return rows
+
+
+_TABLE: Optional[ZipCrosswalk] = None
+_LOADED = False
+
+
+def table() -> Optional[ZipCrosswalk]:
+    """The bundled crosswalk, mapped on first use; None if it isn't installed."""
+    global _TABLE, _LOADED
+    if not _LOADED:
+        _LOADED = True
+        if os.path.exists(DEFAULT_PATH):
+            _TABLE = ZipCrosswalk.open(DEFAULT_PATH)
+    return _TABLE
+
+
+if __name__ == "__main__":
+    src, dst = sys.argv[1], sys.argv[2]
+    blob = build(read_csv(src))
+    os.makedirs(os.path.dirname(os.path.abspath(dst)), exist_ok=True)
+    with open(dst, "wb") as f:
+        f.write(blob)
+    print(f"wrote {dst} ({len(blob)} bytes)")
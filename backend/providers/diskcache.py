@@ -0,0 +1,141 @@
+# backend/providers/diskcache.py
+"""
+Optional on-disk cache shared by every worker process on a host.
+
+SQLite in WAL mode lets many readers and one writer run concurrently
+across uvicorn workers. Two tables:
+  - geocode: normalized query → JSON list of [state, district]
+  - blobs:   named opaque values (the packed legislator roster)
+Rows carry an absolute expiry; prune() drops expired rows in bulk.
+
+Enabled by setting EAGLEREACH_DISK_CACHE to a file path.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+DISK_CACHE_PATH = os.getenv("EAGLEREACH_DISK_CACHE") or None
+GEOCODE_TTL = float(os.getenv("EAGLEREACH_DISK_GEOCODE_TTL", str(30 * 24 * 60 * 60)))
+PRUNE_EVERY = 1000  # writes between bulk prunes
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS geocode (
+    key TEXT PRIMARY KEY,
+    districts TEXT NOT NULL,
+    expires REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS geocode_expires ON geocode (expires);
+CREATE TABLE IF NOT EXISTS blobs (
+    name TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class DiskCache:
+    """Thin SQLite wrapper; one connection per thread, blocking calls run in a worker thread."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._local = threading.local()
+        self._writes = 0
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # --- sync API ---------------------------------------------------------
+    def get_districts_sync(self, key: str) -> Optional[List[Tuple[str, int]]]:
+        row = self._conn().execute(
+            "SELECT districts FROM geocode WHERE key = ? AND expires > ?", (key, time.time())
+        ).fetchone()
+        if row is None:
+            return None
+        return [(s, int(d)) for s, d in json.loads(row[0])]
+
+    def put_districts_sync(self, key: str, districts: List[Tuple[str, int]], ttl: float = GEOCODE_TTL) -> None:
+        self._conn().execute(
+            "INSERT OR REPLACE INTO geocode (key, districts, expires) VALUES (?, ?, ?)",
+            (key, json.dumps(districts, separators=(",", ":")), time.time() + ttl),
+        )
+        self._wrote()
+
+    def get_blob_sync(self, name: str) -> Optional[bytes]:
+        row = self._conn().execute(
+            "SELECT value FROM blobs WHERE name = ? AND expires > ?", (name, time.time())
+        ).fetchone()
+        return bytes(row[0]) if row else None
+
+    def put_blob_sync(self, name: str, value: bytes, ttl: float) -> None:
+        self._conn().execute(
+            "INSERT OR REPLACE INTO blobs (name, value, expires) VALUES (?, ?, ?)",
+            (name, value, time.time() + ttl),
+        )
+        self._wrote()
+
+    def prune_sync(self) -> int:
+        """Delete every expired row; returns how many went."""
+        now = time.time()
+        conn = self._conn()
+        n = conn.execute("DELETE FROM geocode WHERE expires <= ?", (now,)).rowcount
+        n += conn.execute("DELETE FROM blobs WHERE expires <= ?", (now,)).rowcount
+        return n
+
+    def _wrote(self) -> None:
+        self._writes += 1
+        if self._writes % PRUNE_EVERY == 0:
+            self.prune_sync()
+
+    # --- async API --------------------------------------------------------
+    async def get_districts(self, key: str) -> Optional[List[Tuple[str, int]]]:
+        return await self._run(self.get_districts_sync, key)
+
+    async def put_districts(self, key: str, districts: List[Tuple[str, int]]) -> None:
+        await self._run(self.put_districts_sync, key, districts)
+
+    async def get_blob(self, name: str) -> Optional[bytes]:
+        return await self._run(self.get_blob_sync, name)
+
+    async def put_blob(self, name: str, value: bytes, ttl: float) -> None:
+        await self._run(self.put_blob_sync, name, value, ttl)
+
+    async def prune(self) -> Optional[int]:
+        return await self._run(self.prune_sync)
+
+    async def _run(self, fn, *args):
+        # the disk tier is best-effort: a locked or broken file means a miss
+        try:
+            return await asyncio.to_thread(fn, *args)
+        except sqlite3.Error as e:
+            log.warning("disk cache %s failed: %s", fn.__name__, e)
+            return None
+
+
+def _open() -> Optional[DiskCache]:
+    if not DISK_CACHE_PATH:
+        return None
+    try:
+        return DiskCache(DISK_CACHE_PATH)
+    except sqlite3.Error as e:
+        log.warning("disk cache disabled (%s): %s", DISK_CACHE_PATH, e)
+        return None
+
+
+disk = _open()
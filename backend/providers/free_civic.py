@@ -1,12 +1,30 @@
 # backend/providers/free_civic.py
 from __future__ import annotations
 
-import datetime as dt
+import asyncio
+import os
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional, Set, Tuple, Union
 
 import httpx
-from pydantic import BaseModel
+
+from .batch import (
+    BATCH_CHUNK_SIZE,
+    BATCH_CONCURRENCY,
+    BATCH_FALLBACK_CONCURRENCY,
+    Row,
+    census_batch,
+)
+from .cache import LookupCache, normalize_key
+from .clients import pool
+from .crosswalk import table as zip_table
+from . import metrics
+from .diskcache import disk
+from .models import CivicLookupError, Official, UpstreamUnavailable
+from .resilience import guarded, hedge, request_budget
+from .revgeo import index as district_index
+from .roster import LEGISLATORS_URL, roster
 
 
 # ----------------------------
@@ -19,72 +37,21 @@ CENSUS_COORDS_URL = (
     "https://geocoding.geo.census.gov/geocoder/geographies/coordinates"
 )
 ZIPPO_URL = "https://api.zippopotam.us/us/{zip}"
-LEGISLATORS_URL = (
-    "https://unitedstates.github.io/congress-legislators/legislators-current.json"
-)
-
-# ----------------------------
-# Tiny in-memory cache
-# ----------------------------
-_CACHE: Dict[str, Tuple[float, List["Official"]]] = {}
-_CACHE_TTL = 60 * 60  # 1 hour
-
 
 # ----------------------------
-# Models & errors
+# Result cache (bounded LRU + TTL, single-flight)
 # ----------------------------
-class Official(BaseModel):
-    level: str              # 'federal'
-    office: str             # 'US Senator' | 'US Representative'
-    name: str
-    party: Optional[str] = None
-    state: str
-    district: Optional[str] = None
-    phones: List[str] = []
-    urls: List[str] = []
-    photo_url: Optional[str] = None
-    ids: Dict[str, Any] = {}
-
-
-class CivicLookupError(RuntimeError):
-    pass
+_CACHE: LookupCache[List[Official]] = LookupCache(
+    maxsize=int(os.getenv("EAGLEREACH_CACHE_SIZE", "10000")),
+    ttl=60 * 60,  # 1 hour
+    stale_ttl=10 * 60,
+    negative_ttl=60,
+)
 
 
 # ----------------------------
 # Helpers
 # ----------------------------
-async def _load_legislators() -> List[Dict[str, Any]]:
-    """Fetch the current legislators JSON (free & static)."""
-    async with httpx.AsyncClient(timeout=30) as client:
-        r = await client.get(LEGISLATORS_URL)
-        r.raise_for_status()
-        return r.json()
-
-
-def _to_official(person: Dict[str, Any], term: Dict[str, Any]) -> Official:
-    """Convert a legislators-current person+term into our Official model."""
-    name = person.get("name", {})
-    full = (
-        name.get("official_full")
-        or " ".join(x for x in [name.get("first"), name.get("middle"), name.get("last")] if x).strip()
-        or "Unknown"
-    )
-    ids = person.get("id", {})
-    office = "US Senator" if term.get("type") == "sen" else "US Representative"
-    return Official(
-        level="federal",
-        office=office,
-        name=full,
-        party=term.get("party"),
-        state=term.get("state"),
-        district=str(term.get("district")) if "district" in term else None,
-        phones=[p for p in [term.get("phone")] if p],
-        urls=[u for u in [term.get("url")] if u],
-        photo_url=None,
-        ids=ids,
-    )
-
-
 def _extract_state_and_cd(geographies: Dict[str, Any]) -> Optional[Tuple[str, int]]:
     """
     Census 'geographies' is a dict of arrays keyed by labels like:
@@ -122,150 +89,474 @@ def _extract_state_and_cd(geographies: Dict[str, Any]) -> Optional[Tuple[str, in
     return state, district
 
 
+def _zip_districts(zip_code: str) -> List[Tuple[str, int]]:
+    """All (state, district) pairs for a ZIP from the local crosswalk, if any."""
+    xw = zip_table()
+    if xw is None:
+        return []
+    return [(state, district) for state, district, _share in xw.lookup(zip_code)]
+
+
+async def _census_get(url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """One Census GET under the census breaker and deadline."""
+    async def call() -> Dict[str, Any]:
+        r = await pool.client("census").get(url, params=params)
+        r.raise_for_status()
+        return r.json()
+
+    return await guarded("census", call)
+
+
+def _census_stage(endpoint: str, benchmark: str) -> str:
+    """Stage name for a Census call; counts uses of the fallback benchmark."""
+    if benchmark == "Public_AR_Census2020":
+        metrics.BENCHMARK_FALLBACKS.inc(endpoint=endpoint)
+        return f"census_{endpoint}_2020"
+    return f"census_{endpoint}"
+
+
 async def _geocode_zip(zip_code: str) -> Tuple[str, int]:
     """
     Resolve a ZIP to (state_abbr, congressional_district) by:
       1) Getting lat/lon from Zippopotam.us
-      2) Reverse geocoding with Census 'coordinates' endpoint.
+      2) Reverse geocoding locally, or with Census 'coordinates' endpoint.
+    """
+    async def zippo() -> httpx.Response:
+        r = await pool.client("zippopotam").get(ZIPPO_URL.format(zip=zip_code))
+        if r.status_code >= 500:
+            r.raise_for_status()
+        return r
+
+    with metrics.stage("zippopotam"):
+        zr = await guarded("zippopotam", zippo)
+    if zr.status_code != 200:
+        raise CivicLookupError(f"ZIP code {zip_code} not found.")
+    z = zr.json()
+    places = z.get("places") or []
+    if not places:
+        raise CivicLookupError(f"No place found for ZIP {zip_code}.")
+    p = places[0]
+    lat = p.get("latitude")
+    lng = p.get("longitude")
+    if not lat or not lng:
+        raise CivicLookupError(f"Coordinates unavailable for ZIP {zip_code}.")
+
+    return await _reverse_geocode(float(lat), float(lng), what="ZIP")
+
+
+async def _census_coords(lat: float, lng: float, benchmark: str) -> Optional[Tuple[str, int]]:
+    params = {
+        "x": lng,  # longitude
+        "y": lat,  # latitude
+        "benchmark": benchmark,
+        "vintage": "Current_Current",
+        "layers": "all",
+        "format": "json",
+    }
+    with metrics.stage(_census_stage("coordinates", benchmark)):
+        data = await _census_get(CENSUS_COORDS_URL, params)
+    geog = (data.get("result") or {}).get("geographies") or {}
+    return _extract_state_and_cd(geog)
+
+
+async def _census_reverse(lat: float, lng: float) -> Optional[Tuple[str, int]]:
+    """
+    Census 'coordinates' endpoint. The "2020" benchmark sometimes works
+    better, so it is hedged in when the current one is slow or misses.
     """
-    async with httpx.AsyncClient(timeout=20) as client:
-        zr = await client.get(ZIPPO_URL.format(zip=zip_code))
-        if zr.status_code != 200:
-            raise CivicLookupError(f"ZIP code {zip_code} not found.")
-        z = zr.json()
-        places = z.get("places") or []
-        if not places:
-            raise CivicLookupError(f"No place found for ZIP {zip_code}.")
-        p = places[0]
-        lat = p.get("latitude")
-        lng = p.get("longitude")
-        if not lat or not lng:
-            raise CivicLookupError(f"Coordinates unavailable for ZIP {zip_code}.")
-
-        params = {
-            "x": float(lng),  # longitude
-            "y": float(lat),  # latitude
-            "benchmark": "Public_AR_Current",
-            "vintage": "Current_Current",
-            "layers": "all",
-            "format": "json",
-        }
-        rr = await client.get(CENSUS_COORDS_URL, params=params)
-        rr.raise_for_status()
-        data = rr.json()
-        geog = (data.get("result") or {}).get("geographies") or {}
-        res = _extract_state_and_cd(geog)
-        if res:
-            return res
-
-        # One more try with the "2020" benchmark which sometimes works better
-        params["benchmark"] = "Public_AR_Census2020"
-        rr2 = await client.get(CENSUS_COORDS_URL, params=params)
-        rr2.raise_for_status()
-        data2 = rr2.json()
-        geog2 = (data2.get("result") or {}).get("geographies") or {}
-        res2 = _extract_state_and_cd(geog2)
-        if res2:
-            return res2
-
-        raise CivicLookupError("Census reverse geocoding failed for that ZIP.")
+    return await hedge(
+        lambda: _census_coords(lat, lng, "Public_AR_Current"),
+        lambda: _census_coords(lat, lng, "Public_AR_Census2020"),
+    )
+
+
+async def _reverse_geocode(lat: float, lng: float, what: str = "location") -> Tuple[str, int]:
+    """Local district polygons first; the Census API only if they miss."""
+    idx = district_index()
+    res = None
+    if idx is not None:
+        with metrics.stage("revgeo_local"):
+            res = idx.locate(lat, lng)
+    if res is None:
+        res = await _census_reverse(lat, lng)
+    if res:
+        return res
+    raise CivicLookupError(f"Census reverse geocoding failed for that {what}.")
+
+
+async def _census_address(address: str, benchmark: str) -> Optional[Dict[str, Any]]:
+    """First 'onelineaddress' match for a benchmark, or None."""
+    params = {
+        "address": address,
+        "benchmark": benchmark,
+        "vintage": "Current_Current",
+        "layers": "all",
+        "format": "json",
+    }
+    with metrics.stage(_census_stage("onelineaddress", benchmark)):
+        data = await _census_get(CENSUS_ONE_LINE_URL, params)
+    matches = (data.get("result") or {}).get("addressMatches") or []
+    return matches[0] if matches else None
 
 
 async def _geocode_address(address: str) -> Tuple[str, int]:
     """
     Resolve a full street address to (state_abbr, congressional_district)
-    using the Census 'onelineaddress' endpoint, with a fallback benchmark.
+    using the Census 'onelineaddress' endpoint, hedged with the 2020 benchmark.
     """
-    async with httpx.AsyncClient(timeout=20) as client:
-        params = {
-            "address": address,
-            "benchmark": "Public_AR_Current",
-            "vintage": "Current_Current",
-            "layers": "all",
-            "format": "json",
-        }
-        r = await client.get(CENSUS_ONE_LINE_URL, params=params)
-        r.raise_for_status()
-        data = r.json()
-        matches = (data.get("result") or {}).get("addressMatches") or []
-        if not matches:
-            # retry with 2020 benchmark
-            params["benchmark"] = "Public_AR_Census2020"
-            r2 = await client.get(CENSUS_ONE_LINE_URL, params=params)
-            r2.raise_for_status()
-            data2 = r2.json()
-            matches = (data2.get("result") or {}).get("addressMatches") or []
-            if not matches:
-                raise CivicLookupError("No geocoding match for that address.")
-
-        geog = matches[0].get("geographies") or {}
-        res = _extract_state_and_cd(geog)
-        if res:
-            return res
-        raise CivicLookupError("Could not extract state/district for that address.")
+    match = await hedge(
+        lambda: _census_address(address, "Public_AR_Current"),
+        lambda: _census_address(address, "Public_AR_Census2020"),
+    )
+    if not match:
+        raise CivicLookupError("No geocoding match for that address.")
+
+    geog = match.get("geographies") or {}
+    res = _extract_state_and_cd(geog)
+    if res:
+        return res
+    raise CivicLookupError("Could not extract state/district for that address.")
+
+
+# --------------------------------------------------
+# App lifecycle
+# --------------------------------------------------
+@asynccontextmanager
+async def lifespan(app: Any) -> AsyncIterator[None]:
+    """
+    FastAPI lifespan: map the ZIP crosswalk, load district boundaries, warm
+    the roster and start its refresher, then close the shared upstream
+    clients on shutdown.
+    """
+    zip_table()  # map the crosswalk now rather than on the first lookup
+    if disk is not None:
+        await disk.prune()  # best-effort, like every disk cache call
+    await asyncio.to_thread(district_index)
+    await roster.start()  # never raises; retries in the background
+    try:
+        yield
+    finally:
+        await roster.stop()
+        await pool.aclose()
 
 
 # --------------------------------------------------
 # Public helpers used by the /ask route
 # --------------------------------------------------
 async def address_from_zip(zip_code: str) -> str:
-    """Validate that a user-provided ZIP looks like a ZIP; pass through as-is."""
+    """
+    Validate that a user-provided ZIP looks like a ZIP; pass through as-is.
+    ZIPs missing from the local crosswalk are still accepted and resolved
+    over the network later.
+    """
     if not (zip_code.isdigit() and len(zip_code) == 5):
         raise CivicLookupError(f"Invalid ZIP code format: {zip_code}")
     return zip_code
 
 
+async def reverse_geocode(lat: float, lon: float) -> Tuple[str, int]:
+    """(state_abbr, congressional_district) for a coordinate, as used by /revgeo."""
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise CivicLookupError("Coordinates out of range.")
+    with request_budget():
+        return await _reverse_geocode(lat, lon)
+
+
+async def get_district_officials(state: str, district: int) -> List[Official]:
+    """
+    Senators plus the House member for a known (state, district), e.g. from
+    /revgeo. A seat with no current House member is not found.
+    """
+    state = state.upper()
+    current = await roster.get()
+    results = current.officials_for(state, district)
+    if not any(o.office == "US Representative" for o in results):
+        raise CivicLookupError(f"No current representative for {state}-{district}.")
+    return results
+
+
 async def get_federal_officials(address: str) -> List[Official]:
     """
-    Main entry point for the free civic provider:
-      - If a 5-digit ZIP is provided, ZIP→lat/lon→Census geographies
-      - Else treat as a street address with Census 'onelineaddress'
-      - Map (state,district) to Senators + House Rep using congress-legislators
+    Main entry point for the free civic provider. Results are cached per
+    normalized address; concurrent identical lookups share one upstream
+    call and "not found" answers are remembered briefly. Upstream calls
+    share one request budget (EAGLEREACH_REQUEST_BUDGET seconds).
+    """
+    query = address.strip()
+    key = normalize_key(query)
+
+    kind = "zip" if query.isdigit() and len(query) == 5 else "address"
+    loaded = False
+    t0 = time.perf_counter()
+
+    async def load() -> List[Official]:
+        nonlocal loaded
+        loaded = True
+        with request_budget(), metrics.lookup(kind):
+            return await _lookup_federal_officials(query, key)
+
+    try:
+        results = await _CACHE.get_or_load(key, load)
+    except CivicLookupError as e:
+        if not loaded:
+            metrics.cached(kind, type(e).__name__, time.perf_counter() - t0)
+        raise
+    if not loaded:
+        metrics.cached(kind, "hit", time.perf_counter() - t0)
+    return list(results)
+
+
+def cache_stats() -> Dict[str, int]:
+    """Hit/miss/eviction counters of the officials cache."""
+    return _CACHE.stats()
+
+
+_CACHE_GAUGES = ("size", "maxsize", "inflight")
+metrics.add_collector(
+    "eaglereach_cache_events_total", "counter", "Officials cache events.",
+    lambda: [("", {"event": k}, v) for k, v in _CACHE.stats().items() if k not in _CACHE_GAUGES],
+)
+metrics.add_collector(
+    "eaglereach_cache_entries", "gauge", "Officials cache occupancy.",
+    lambda: [("", {"kind": k}, v) for k, v in _CACHE.stats().items() if k in _CACHE_GAUGES],
+)
+
+
+async def _geocode(address: str, key: str) -> List[Tuple[str, int]]:
+    """
+    (state, district) pairs for a query: local ZIP crosswalk, then the
+    shared disk cache, then the network (whose answer is written back).
     """
-    now = time.time()
-    cached = _CACHE.get(address)
-    if cached and (now - cached[0] < _CACHE_TTL):
-        return cached[1]
-
-    # 1) Geocode → (state, district)
-    if address.isdigit() and len(address) == 5:
-        state, district = await _geocode_zip(address)
+    is_zip = address.isdigit() and len(address) == 5
+    if is_zip:
+        with metrics.stage("crosswalk"):
+            districts = _zip_districts(address)
+        if districts:
+            return districts
+
+    if disk is not None:
+        with metrics.stage("disk_cache"):
+            cached = await disk.get_districts(key)
+        if cached:
+            return cached
+
+    if is_zip:
+        districts = [await _geocode_zip(address)]
     else:
-        state, district = await _geocode_address(address)
+        districts = [await _geocode_address(address)]
 
-    # 2) Load legislators + filter by (state, district)
-    legislators = await _load_legislators()
-    senators: List[Official] = []
-    representative: Optional[Official] = None
+    if disk is not None:
+        await disk.put_districts(key, districts)
+    return districts
 
-    for person in legislators:
-        terms = person.get("terms") or []
-        term = terms[-1] if terms else None
-        if not term:
-            continue
 
-        # Ensure current
-        try:
-            end = dt.date.fromisoformat(term.get("end", "1900-01-01"))
-            if end < dt.date.today():
-                continue
-        except Exception:
-            # ignore bad dates
-            pass
-
-        ttype = term.get("type")
-        tstate = term.get("state")
-        if ttype == "sen" and tstate == state:
-            senators.append(_to_official(person, term))
-        elif ttype == "rep" and tstate == state:
-            td = int(term.get("district", 0))
-            if int(district) == td:
-                representative = _to_official(person, term)
-
-    senators = senators[:2]
-    results = senators + ([representative] if representative else [])
+async def _lookup_federal_officials(address: str, key: str) -> List[Official]:
+    """
+    Uncached lookup:
+      - If a 5-digit ZIP is provided, use the local ZIP→district crosswalk,
+        falling back to ZIP→lat/lon→Census geographies for unknown ZIPs
+      - Else treat as a street address with Census 'onelineaddress'
+      - Network geocodes go through the shared on-disk cache when enabled
+      - Map (state,district) to Senators + House Rep via the resident roster index
+    """
+    # 1) Geocode → [(state, district), ...] (several for split ZIPs)
+    districts = await _geocode(address, key)
+
+    # 2) Resident roster → Senators + House Rep(s) for those districts
+    with metrics.stage("roster"):
+        current = await roster.get()
+    with metrics.stage("officials_match"):
+        results = current.officials_for_districts(districts)
     if not results:
         raise CivicLookupError("No current federal officials found for that district.")
 
-    _CACHE[address] = (now, results)
     return results
+
+
+# --------------------------------------------------
+# Batch lookups
+# --------------------------------------------------
+_Outcome = Union[List[Official], CivicLookupError]
+
+
+async def _batch_geocode(
+    rows: List[Row], slots: asyncio.Semaphore
+) -> List[Union[List[Tuple[str, int]], CivicLookupError]]:
+    """
+    Street addresses → districts via the Census batch geocoder, retrying
+    misses on the 2020 benchmark. Coordinates are resolved to districts
+    locally when boundaries are installed, else per point through Census
+    (at most `slots` at a time).
+    """
+    coords: Dict[int, Tuple[float, float]] = {}
+    todo = list(range(len(rows)))
+    failed: Optional[CivicLookupError] = None
+    for benchmark in ("Public_AR_Current", "Public_AR_Census2020"):
+        if not todo:
+            break
+        try:
+            with metrics.stage(_census_stage("batch", benchmark)):
+                found = await census_batch([rows[i] for i in todo], benchmark=benchmark)
+        except CivicLookupError as e:
+            failed = e
+            continue
+        except httpx.HTTPError as e:
+            failed = CivicLookupError(f"Census batch geocoder unavailable: {e}")
+            continue
+        failed = None
+        coords.update({todo[j]: ll for j, ll in found.items()})
+        todo = [i for i in todo if i not in coords]
+
+    # rows still in `todo` either had no match or hit a failed request;
+    # matches found on an earlier benchmark are kept either way
+    miss = failed or CivicLookupError("No geocoding match for that address.")
+    out: List[Union[List[Tuple[str, int]], CivicLookupError]] = [miss for _ in rows]
+    matched = sorted(coords)
+    idx = district_index()
+    located = (
+        idx.locate_many([coords[i][0] for i in matched], [coords[i][1] for i in matched])
+        if idx is not None else [None] * len(matched)
+    )
+
+    async def resolve(i: int, hit: Optional[Tuple[str, int]]) -> None:
+        if hit is not None:
+            out[i] = [hit]
+            return
+        try:
+            async with slots:
+                out[i] = [await _reverse_geocode(*coords[i], what="address")]
+        except CivicLookupError as e:
+            out[i] = e
+        except httpx.HTTPError as e:
+            out[i] = CivicLookupError(f"Census reverse geocoding unavailable: {e}")
+
+    await asyncio.gather(*(resolve(i, hit) for i, hit in zip(matched, located)))
+    return out
+
+
+async def _batch_chunk(rows: List[Row], slots: asyncio.Semaphore) -> List[Dict[str, Any]]:
+    """
+    Resolve one chunk; every row gets a result line, errors included.
+    Per-key network fallbacks share the job's `slots` so a large upload
+    cannot take over the census pool from interactive lookups.
+    """
+    groups: Dict[str, List[Row]] = {}
+    lines: List[Dict[str, Any]] = []
+    for r in rows:
+        if "error" in r:
+            # could not be parsed; report it and move on
+            lines.append({"id": r["id"], "error": r["error"]})
+        else:
+            groups.setdefault(normalize_key(r["address"]), []).append(r)
+
+    outcomes: Dict[str, _Outcome] = {}
+    districts: Dict[str, List[Tuple[str, int]]] = {}
+    zips: List[str] = []
+    to_batch: List[str] = []
+    for key, rs in groups.items():
+        address = rs[0]["address"]
+        if not key:
+            outcomes[key] = CivicLookupError("Empty address.")
+        elif address.isdigit() and len(address) == 5:
+            zips.append(key)
+        else:
+            cached = await disk.get_districts(key) if disk is not None else None
+            if cached:
+                districts[key] = cached
+            else:
+                to_batch.append(key)
+
+    async def by_zip(key: str) -> None:
+        try:
+            async with slots:
+                outcomes[key] = await get_federal_officials(groups[key][0]["address"])
+        except CivicLookupError as e:
+            outcomes[key] = e
+        except httpx.HTTPError as e:
+            outcomes[key] = CivicLookupError(f"Lookup unavailable: {e}")
+
+    await asyncio.gather(*(by_zip(k) for k in zips))
+
+    if to_batch:
+        try:
+            geocoded = await _batch_geocode([groups[k][0] for k in to_batch], slots)
+        except CivicLookupError as e:
+            geocoded = [e] * len(to_batch)
+        except httpx.HTTPError as e:
+            err = CivicLookupError(f"Census batch geocoder unavailable: {e}")
+            geocoded = [err] * len(to_batch)
+        for key, res in zip(to_batch, geocoded):
+            if isinstance(res, CivicLookupError):
+                outcomes[key] = res
+            else:
+                districts[key] = res
+                if disk is not None:
+                    await disk.put_districts(key, res)
+
+    if districts:
+        try:
+            current = await roster.get()
+        except CivicLookupError as e:
+            outcomes.update((key, e) for key in districts)
+        except httpx.HTTPError as e:
+            err = CivicLookupError(f"Legislator roster unavailable: {e}")
+            outcomes.update((key, err) for key in districts)
+        else:
+            for key, ds in districts.items():
+                officials = current.officials_for_districts(ds)
+                outcomes[key] = officials or CivicLookupError(
+                    "No current federal officials found for that district."
+                )
+
+    for key, rs in groups.items():
+        res = outcomes[key]
+        for r in rs:
+            line: Dict[str, Any] = {"id": r["id"], "input": r["address"]}
+            if isinstance(res, CivicLookupError):
+                line["error"] = str(res)
+            else:
+                line["officials"] = res
+            lines.append(line)
+    return lines
+
+
+async def get_federal_officials_batch(
+    rows: AsyncIterable[Row],
+    chunk_size: int = BATCH_CHUNK_SIZE,
+    concurrency: int = BATCH_CONCURRENCY,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Bulk version of get_federal_officials. Rows (see batch.parse_rows) are
+    deduplicated per chunk, chunks are geocoded with bounded concurrency,
+    and one result dict per input row is yielded as each chunk finishes,
+    so output order follows completion, not input. At most `concurrency`
+    chunks are held at once, whatever the input size, and at most
+    EAGLEREACH_BATCH_FALLBACK_CONCURRENCY per-row upstream fallbacks run
+    across them.
+    """
+    slots = asyncio.Semaphore(BATCH_FALLBACK_CONCURRENCY)
+    pending: Set["asyncio.Task[List[Dict[str, Any]]]"] = set()
+    chunk: List[Row] = []
+    try:
+        async for row in rows:
+            chunk.append(row)
+            if len(chunk) < chunk_size:
+                continue
+            pending.add(asyncio.create_task(_batch_chunk(chunk, slots)))
+            chunk = []
+            while len(pending) >= concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for t in done:
+                    for line in t.result():
+                        yield line
+        if chunk:
+            pending.add(asyncio.create_task(_batch_chunk(chunk, slots)))
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for t in done:
+                for line in t.result():
+                    yield line
+    finally:
+        # client went away mid-stream
+        for t in pending:
+            t.cancel()
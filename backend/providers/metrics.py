@@ -0,0 +1,203 @@
+# backend/providers/metrics.py
+"""
+Minimal Prometheus-style metrics for the lookup pipeline.
+
+Counters and histograms are plain dicts keyed by label values, updated
+from the event loop, so recording costs a dict lookup and a bisect.
+render() emits the text exposition format for /metrics; collectors
+registered with add_collector() contribute values (cache counters,
+breaker states) at scrape time. Metrics are per process: with several
+uvicorn workers, each scrape sees one worker.
+
+Set EAGLEREACH_TIMING_LOG=1 to log one JSON line per officials lookup:
+per-stage timings when it had to be loaded, just the total when the
+cache answered (outcome "hit", or the cached error).
+"""
+from __future__ import annotations
+
+import contextvars
+import json
+import logging
+import os
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+log = logging.getLogger("eaglereach.timing")
+
+TIMING_LOG = os.getenv("EAGLEREACH_TIMING_LOG", "0").lower() in ("1", "true", "yes")
+if TIMING_LOG and not log.handlers:
+    # uvicorn leaves the root logger at WARNING; give timing lines their own way out
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(_handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+Labels = Tuple[str, ...]
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _fmt_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(
+        f'{k}="{str(v).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for k, v in labels.items()
+    )
+    return "{" + inner + "}"
+
+
+class Counter:
+    def __init__(self, name: str, doc: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.doc = doc
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(str(labels[n]) for n in self.labelnames)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.doc}"
+        yield f"# TYPE {self.name} counter"
+        for key, v in sorted(self._values.items()):
+            yield f"{self.name}{_fmt_labels(dict(zip(self.labelnames, key)))} {v}"
+
+
+class Histogram:
+    def __init__(
+        self, name: str, doc: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = BUCKETS
+    ) -> None:
+        self.name = name
+        self.doc = doc
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # per label set: [bucket counts..., +Inf count], sum
+        self._values: Dict[Labels, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels[n]) for n in self.labelnames)
+        slot = self._values.get(key)
+        if slot is None:
+            slot = self._values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+        slot[0][bisect_left(self.buckets, value)] += 1
+        slot[1][0] += value
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.doc}"
+        yield f"# TYPE {self.name} histogram"
+        for key, (counts, total) in sorted(self._values.items()):
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                yield f"{self.name}_bucket{_fmt_labels({**labels, 'le': le})} {cumulative}"
+            yield f"{self.name}_sum{_fmt_labels(labels)} {total[0]}"
+            yield f"{self.name}_count{_fmt_labels(labels)} {cumulative}"
+
+
+# ----------------------------
+# Pipeline metrics
+# ----------------------------
+LOOKUP_SECONDS = Histogram(
+    "eaglereach_lookup_seconds", "End-to-end officials lookups.", ("kind", "outcome")
+)
+STAGE_SECONDS = Histogram(
+    "eaglereach_stage_seconds", "Time spent in each lookup stage.", ("stage",)
+)
+UPSTREAM_SECONDS = Histogram(
+    "eaglereach_upstream_seconds", "Upstream HTTP time to response headers.", ("host",)
+)
+UPSTREAM_REQUESTS = Counter(
+    "eaglereach_upstream_requests_total", "Upstream HTTP requests by status.", ("host", "status")
+)
+BENCHMARK_FALLBACKS = Counter(
+    "eaglereach_benchmark_fallback_total",
+    "Census Public_AR_Census2020 fallback attempts.", ("endpoint",)
+)
+
+_METRICS: List = [LOOKUP_SECONDS, STAGE_SECONDS, UPSTREAM_SECONDS, UPSTREAM_REQUESTS, BENCHMARK_FALLBACKS]
+_COLLECTORS: List[Tuple[str, str, str, Callable[[], Iterable[Sample]]]] = []
+
+_timings: contextvars.ContextVar[Optional[Dict[str, float]]] = contextvars.ContextVar(
+    "eaglereach_timings", default=None
+)
+
+
+def add_collector(name: str, kind: str, doc: str, collect: Callable[[], Iterable[Sample]]) -> None:
+    """Register a scrape-time source of (suffix, labels, value) samples."""
+    _COLLECTORS.append((name, kind, doc, collect))
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a block into eaglereach_stage_seconds and the current request's timings."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        dt = time.perf_counter() - t0
+        STAGE_SECONDS.observe(dt, stage=name)
+        timings = _timings.get()
+        if timings is not None:
+            timings[name] = timings.get(name, 0.0) + dt
+
+
+@contextmanager
+def lookup(kind: str) -> Iterator[Dict[str, float]]:
+    """
+    Wrap one uncached lookup: records eaglereach_lookup_seconds and, with
+    EAGLEREACH_TIMING_LOG on, logs the per-stage breakdown.
+    """
+    timings: Dict[str, float] = {}
+    token = _timings.set(timings)
+    outcome = "ok"
+    t0 = time.perf_counter()
+    try:
+        yield timings
+    except Exception as e:
+        outcome = type(e).__name__
+        raise
+    finally:
+        total = time.perf_counter() - t0
+        _timings.reset(token)
+        LOOKUP_SECONDS.observe(total, kind=kind, outcome=outcome)
+        if TIMING_LOG:
+            log.info(json.dumps({
+                "event": "lookup",
+                "kind": kind,
+                "outcome": outcome,
+                "total_ms": round(total * 1000, 3),
+                "stages_ms": {k: round(v * 1000, 3) for k, v in timings.items()},
+            }))
+
+
+def cached(kind: str, outcome: str, seconds: float) -> None:
+    """Timing line for a lookup answered from the cache, without stages."""
+    if TIMING_LOG:
+        log.info(json.dumps({
+            "event": "lookup",
+            "kind": kind,
+            "outcome": outcome,
+            "cached": True,
+            "total_ms": round(seconds * 1000, 3),
+        }))
+
+
+def render() -> str:
+    lines: List[str] = []
+    for m in _METRICS:
+        lines.extend(m.render())
+    for name, kind, doc, collect in _COLLECTORS:
+        lines.append(f"# HELP {name} {doc}")
+        lines.append(f"# TYPE {name} {kind}")
+        for suffix, labels, value in collect():
+            lines.append(f"{name}{suffix}{_fmt_labels(labels)} {value}")
+    return "\n".join(lines) + "\n"
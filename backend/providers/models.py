@@ -0,0 +1,30 @@
+# backend/providers/models.py
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+# ----------------------------
+# Models & errors
+# ----------------------------
+class Official(BaseModel):
+    level: str              # 'federal'
+    office: str             # 'US Senator' | 'US Representative'
+    name: str
+    party: Optional[str] = None
+    state: str
+    district: Optional[str] = None
+    phones: List[str] = []
+    urls: List[str] = []
+    photo_url: Optional[str] = None
+    ids: Dict[str, Any] = {}
+
+
+class CivicLookupError(RuntimeError):
+    pass
+
+
+class UpstreamUnavailable(CivicLookupError):
+    """A free upstream is down, slow or circuit-broken; worth retrying later."""
@@ -0,0 +1,196 @@
+# backend/providers/resilience.py
+"""
+Bounded-latency calls to the free upstreams:
+  - every call gets min(per-upstream deadline, what is left of the
+    request budget) as a hard timeout
+  - a circuit breaker per upstream fails fast after repeated failures
+    and lets a single probe through once it has cooled down
+  - hedge() starts a backup attempt when the first is slow and takes
+    whichever produces an answer first
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, Iterator, Optional, Tuple, TypeVar
+
+import httpx
+
+from . import metrics
+from .clients import UPSTREAMS
+from .models import UpstreamUnavailable
+
+T = TypeVar("T")
+
+REQUEST_BUDGET = float(os.getenv("EAGLEREACH_REQUEST_BUDGET", "10"))
+HEDGE_DELAY = float(os.getenv("EAGLEREACH_HEDGE_DELAY", "1.5"))
+# per-upstream hard timeouts: the client settings (EAGLEREACH_<UPSTREAM>_TIMEOUT)
+DEADLINES: Dict[str, float] = {name: u.timeout for name, u in UPSTREAMS.items()}
+# bulk uploads; own breaker so a failing batch job can't open "census"
+DEADLINES["census_batch"] = float(os.getenv("EAGLEREACH_BATCH_TIMEOUT", "300"))
+BREAKER_THRESHOLD = int(os.getenv("EAGLEREACH_BREAKER_THRESHOLD", "5"))
+BREAKER_COOLDOWN = float(os.getenv("EAGLEREACH_BREAKER_COOLDOWN", "30"))
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "eaglereach_deadline", default=None
+)
+
+
+@contextmanager
+def request_budget(seconds: float = REQUEST_BUDGET) -> Iterator[None]:
+    """Bound every upstream call made inside the block by one overall deadline."""
+    token = _deadline.set(time.monotonic() + seconds)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+class CircuitBreaker:
+    """
+    closed → open after `threshold` consecutive failures; open → half-open
+    after `cooldown` seconds, where one probe decides whether to close.
+    """
+
+    def __init__(self, name: str, threshold: int = BREAKER_THRESHOLD, cooldown: float = BREAKER_COOLDOWN) -> None:
+        self.name = name
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> Tuple[bool, bool]:
+        """
+        (admitted, probe). `probe` is True for the single call let through
+        while half-open; only that call may release_probe().
+        """
+        state = self.state
+        if state == "closed":
+            return True, False
+        if state == "half-open" and not self._probing:
+            self._probing = True
+            return True, True
+        return False, False
+
+    def release_probe(self) -> None:
+        self._probing = False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self, probe: bool = False) -> None:
+        self.failures += 1
+        if probe or self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+
+
+breakers: Dict[str, CircuitBreaker] = {name: CircuitBreaker(name) for name in DEADLINES}
+metrics.add_collector(
+    "eaglereach_circuit_open", "gauge", "1 while an upstream's circuit breaker is not closed.",
+    lambda: [("", {"upstream": n}, int(b.state != "closed")) for n, b in breakers.items()],
+)
+
+
+def _timeout_for(upstream: str) -> Tuple[float, bool]:
+    """(seconds, True if the request budget rather than the upstream's deadline is the limit)."""
+    timeout = DEADLINES[upstream]
+    deadline = _deadline.get()
+    if deadline is not None and deadline - time.monotonic() < timeout:
+        return deadline - time.monotonic(), True
+    return timeout, False
+
+
+async def guarded(upstream: str, call: Callable[[], Awaitable[T]]) -> T:
+    """
+    Run one upstream call under its breaker and deadline. Timeouts,
+    transport errors, 5xx responses and unusable bodies (bad JSON, bad
+    encoding) count as failures and surface as UpstreamUnavailable; a 4xx
+    means the upstream is answering. However the call ends, a half-open
+    probe is settled by the call that took it. Running out of the request
+    budget is not held against the upstream.
+    """
+    breaker = breakers[upstream]
+    admitted, probe = breaker.allow()
+    if not admitted:
+        raise UpstreamUnavailable(f"{upstream} is unavailable right now; try again shortly.")
+    try:
+        timeout, budget_bound = _timeout_for(upstream)
+        if timeout <= 0:
+            raise UpstreamUnavailable("Lookup took too long; try again shortly.")
+        try:
+            result = await asyncio.wait_for(call(), timeout)
+        except asyncio.TimeoutError as e:
+            if budget_bound:
+                raise UpstreamUnavailable("Lookup took too long; try again shortly.") from e
+            breaker.record_failure(probe)
+            raise UpstreamUnavailable(f"{upstream} did not answer in time.") from e
+        except httpx.TransportError as e:
+            breaker.record_failure(probe)
+            raise UpstreamUnavailable(f"{upstream} did not answer in time.") from e
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code >= 500:
+                breaker.record_failure(probe)
+                raise UpstreamUnavailable(f"{upstream} returned {e.response.status_code}.") from e
+            breaker.record_success()
+            raise
+        except Exception as e:
+            # e.g. an HTML error page served with 200, or a broken gzip stream
+            breaker.record_failure(probe)
+            raise UpstreamUnavailable(f"{upstream} sent an unusable response.") from e
+    finally:
+        # however it ended (a lost hedge race is a CancelledError), a probe
+        # must not keep the slot
+        if probe:
+            breaker.release_probe()
+    breaker.record_success()
+    return result
+
+
+async def hedge(
+    primary: Callable[[], Awaitable[Optional[T]]],
+    backup: Callable[[], Awaitable[Optional[T]]],
+    delay: float = HEDGE_DELAY,
+) -> Optional[T]:
+    """
+    Run `primary`; if it hasn't answered after `delay` seconds (or answers
+    None / fails), start `backup` too. The first non-None answer wins and
+    the other attempt is cancelled. Returns None if neither has one; if
+    both fail, re-raises the primary's error.
+    """
+    first = asyncio.ensure_future(primary())
+    second: Optional[asyncio.Future] = None
+    try:
+        done, _ = await asyncio.wait({first}, timeout=delay)
+        if done and first.exception() is None and first.result() is not None:
+            return first.result()
+
+        second = asyncio.ensure_future(backup())
+        pending = {first, second} - done
+        finished = set(done)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            finished |= done
+            for f in done:
+                if f.exception() is None and f.result() is not None:
+                    return f.result()
+
+        if all(f.exception() is not None for f in finished):
+            raise first.exception()  # type: ignore[misc]
+        return None
+    finally:
+        for f in (first, second):
+            if f is not None and not f.done():
+                f.cancel()
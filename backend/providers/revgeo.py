@@ -0,0 +1,172 @@
+# backend/providers/revgeo.py
+"""
+In-process reverse geocoder: (lat, lon) → (state_abbr, district).
+
+Congressional district boundaries are read once from a GeoJSON file
+(e.g. a Census cartographic boundary file converted with ogr2ogr) whose
+features carry STATEFP and a CDxxxFP property. Polygon parts are bucketed
+into a uniform lat/lon grid by bounding box; a lookup only tests the
+parts registered in the point's cell, with a vectorized even-odd ray
+cast over all edges (holes included) of each candidate part.
+"""
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_PATH = os.getenv(
+    "EAGLEREACH_CD_BOUNDARIES",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "cd.geojson"),
+)
+CELL_DEGREES = float(os.getenv("EAGLEREACH_REVGEO_CELL", "0.5"))
+_MAX_CELLS = 1 << 21  # points × edges per vectorized block
+
+STATE_FIPS: Dict[str, str] = {
+    "01": "AL", "02": "AK", "04": "AZ", "05": "AR", "06": "CA", "08": "CO",
+    "09": "CT", "10": "DE", "11": "DC", "12": "FL", "13": "GA", "15": "HI",
+    "16": "ID", "17": "IL", "18": "IN", "19": "IA", "20": "KS", "21": "KY",
+    "22": "LA", "23": "ME", "24": "MD", "25": "MA", "26": "MI", "27": "MN",
+    "28": "MS", "29": "MO", "30": "MT", "31": "NE", "32": "NV", "33": "NH",
+    "34": "NJ", "35": "NM", "36": "NY", "37": "NC", "38": "ND", "39": "OH",
+    "40": "OK", "41": "OR", "42": "PA", "44": "RI", "45": "SC", "46": "SD",
+    "47": "TN", "48": "TX", "49": "UT", "50": "VT", "51": "VA", "53": "WA",
+    "54": "WV", "55": "WI", "56": "WY", "60": "AS", "66": "GU", "69": "MP",
+    "72": "PR", "78": "VI",
+}
+
+
+def _district_of(props: Dict[str, Any]) -> Optional[Tuple[str, int]]:
+    """(state, district) from Census feature properties, same shape as _extract_state_and_cd."""
+    state = STATE_FIPS.get(str(props.get("STATEFP") or ""))
+    if not state:
+        return None
+    cd_key = next((k for k in props if k.startswith("CD") and k.endswith("FP")), None)
+    cd = str(props.get(cd_key) or "") if cd_key else ""
+    if not cd.isdigit():
+        # "ZZ" marks water / undefined areas
+        return None
+    district = int(cd)
+    # 00 = at-large, 98 = non-voting delegate; both are district 0 downstream
+    return state, (0 if district in (0, 98) else district)
+
+
+class _Part:
+    """One polygon (outer ring + holes) flattened to edge arrays."""
+
+    __slots__ = ("district", "bbox", "x0", "y0", "x1", "y1")
+
+    def __init__(self, district: Tuple[str, int], rings: Sequence[Sequence[Sequence[float]]]) -> None:
+        arrs = [np.asarray(r, dtype=np.float64)[:, :2] for r in rings if len(r) >= 3]
+        pts = np.concatenate(arrs)
+        self.district = district
+        self.bbox = (pts[:, 0].min(), pts[:, 1].min(), pts[:, 0].max(), pts[:, 1].max())
+        starts = np.concatenate([a[:-1] for a in arrs])
+        ends = np.concatenate([a[1:] for a in arrs])
+        self.x0, self.y0 = starts[:, 0], starts[:, 1]
+        self.x1, self.y1 = ends[:, 0], ends[:, 1]
+
+    def contains(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Even-odd test of many points against every edge at once."""
+        step = max(1, _MAX_CELLS // len(self.x0))
+        if len(xs) > step:
+            # keep the points × edges temporaries bounded for big batches
+            return np.concatenate(
+                [self.contains(xs[i:i + step], ys[i:i + step]) for i in range(0, len(xs), step)]
+            )
+        xs = xs[:, None]
+        ys = ys[:, None]
+        crosses = (self.y0 > ys) != (self.y1 > ys)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_at = self.x0 + (ys - self.y0) * (self.x1 - self.x0) / (self.y1 - self.y0)
+        return np.count_nonzero(crosses & (xs < x_at), axis=1) % 2 == 1
+
+
+class DistrictIndex:
+    """Grid-bucketed district polygons; immutable once built."""
+
+    def __init__(self, parts: List[_Part], cell: float = CELL_DEGREES) -> None:
+        self.parts = parts
+        self.cell = cell
+        grid: Dict[Tuple[int, int], List[int]] = {}
+        for i, p in enumerate(parts):
+            minx, miny, maxx, maxy = p.bbox
+            for gx in range(int(np.floor(minx / cell)), int(np.floor(maxx / cell)) + 1):
+                for gy in range(int(np.floor(miny / cell)), int(np.floor(maxy / cell)) + 1):
+                    grid.setdefault((gx, gy), []).append(i)
+        self.grid = {k: tuple(v) for k, v in grid.items()}
+
+    @classmethod
+    def from_geojson(cls, doc: Dict[str, Any], cell: float = CELL_DEGREES) -> "DistrictIndex":
+        parts: List[_Part] = []
+        for feat in doc.get("features") or []:
+            district = _district_of(feat.get("properties") or {})
+            geom = feat.get("geometry") or {}
+            if district is None or not geom:
+                continue
+            if geom.get("type") == "Polygon":
+                polys = [geom["coordinates"]]
+            elif geom.get("type") == "MultiPolygon":
+                polys = geom["coordinates"]
+            else:
+                continue
+            parts.extend(_Part(district, rings) for rings in polys if rings)
+        return cls(parts, cell)
+
+    @classmethod
+    def open(cls, path: str = DEFAULT_PATH) -> "DistrictIndex":
+        with open(path) as f:
+            return cls.from_geojson(json.load(f))
+
+    def locate(self, lat: float, lon: float) -> Optional[Tuple[str, int]]:
+        return self.locate_many([lat], [lon])[0]
+
+    def locate_many(
+        self, lats: Iterable[float], lons: Iterable[float]
+    ) -> List[Optional[Tuple[str, int]]]:
+        """Batch lookup; points sharing a grid cell are tested together."""
+        ys = np.asarray(list(lats), dtype=np.float64)
+        xs = np.asarray(list(lons), dtype=np.float64)
+        out: List[Optional[Tuple[str, int]]] = [None] * len(xs)
+        if not len(xs):
+            return out
+
+        cells: Dict[Tuple[int, int], List[int]] = {}
+        gxs = np.floor(xs / self.cell).astype(np.int64)
+        gys = np.floor(ys / self.cell).astype(np.int64)
+        for i, key in enumerate(zip(gxs.tolist(), gys.tolist())):
+            cells.setdefault(key, []).append(i)
+
+        for key, idx in cells.items():
+            pending = np.asarray(idx)
+            for pi in self.grid.get(key, ()):
+                part = self.parts[pi]
+                minx, miny, maxx, maxy = part.bbox
+                px, py = xs[pending], ys[pending]
+                near = (px >= minx) & (px <= maxx) & (py >= miny) & (py <= maxy)
+                if not near.any():
+                    continue
+                hit = np.zeros(len(pending), dtype=bool)
+                hit[near] = part.contains(px[near], py[near])
+                for i in pending[hit].tolist():
+                    out[i] = part.district
+                pending = pending[~hit]
+                if not len(pending):
+                    break
+        return out
+
+
+_INDEX: Optional[DistrictIndex] = None
+_LOADED = False
+
+
+def index() -> Optional[DistrictIndex]:
+    """The district boundaries, loaded on first use; None if not installed."""
+    global _INDEX, _LOADED
+    if not _LOADED:
+        _LOADED = True
+        if os.path.exists(DEFAULT_PATH):
+            _INDEX = DistrictIndex.open(DEFAULT_PATH)
+    return _INDEX
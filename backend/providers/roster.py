@@ -0,0 +1,340 @@
+# backend/providers/roster.py
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import json
+import logging
+import os
+import time
+import zlib
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import httpx
+
+from . import metrics
+from .clients import pool
+from .diskcache import disk
+from .models import CivicLookupError, Official
+from .resilience import guarded
+
+log = logging.getLogger(__name__)
+
+LEGISLATORS_URL = (
+    "https://unitedstates.github.io/congress-legislators/legislators-current.json"
+)
+ROSTER_REFRESH_SECONDS = int(os.getenv("EAGLEREACH_ROSTER_REFRESH", str(6 * 60 * 60)))
+ROSTER_DISK_TTL = 24 * 60 * 60  # a day-old roster is still a fine warm start
+ROSTER_RETRY_SECONDS = 5  # after a failed first load; doubles up to the refresh interval
+
+# (term end date or None if unparseable, official)
+_Entry = Tuple[Optional[dt.date], Official]
+
+
+def _to_official(person: Dict[str, Any], term: Dict[str, Any]) -> Official:
+    """Convert a legislators-current person+term into our Official model."""
+    name = person.get("name", {})
+    full = (
+        name.get("official_full")
+        or " ".join(x for x in [name.get("first"), name.get("middle"), name.get("last")] if x).strip()
+        or "Unknown"
+    )
+    ids = person.get("id", {})
+    office = "US Senator" if term.get("type") == "sen" else "US Representative"
+    return Official(
+        level="federal",
+        office=office,
+        name=full,
+        party=term.get("party"),
+        state=term.get("state"),
+        district=str(term.get("district")) if "district" in term else None,
+        phones=[p for p in [term.get("phone")] if p],
+        urls=[u for u in [term.get("url")] if u],
+        photo_url=None,
+        ids=ids,
+    )
+
+
+def _parse_end(term: Dict[str, Any]) -> Optional[dt.date]:
+    try:
+        return dt.date.fromisoformat(term.get("end", "1900-01-01"))
+    except Exception:
+        # ignore bad dates
+        return None
+
+
+def _pack(entry: _Entry) -> list:
+    """Positional, compact form of (end, Official) for the disk cache."""
+    end, o = entry
+    return [
+        end.isoformat() if end else None,
+        "s" if o.office == "US Senator" else "r",
+        o.name, o.party, o.state, o.district, o.phones, o.urls, o.ids,
+    ]
+
+
+def _unpack(row: list) -> _Entry:
+    end, office, name, party, state, district, phones, urls, ids = row
+    return (
+        dt.date.fromisoformat(end) if end else None,
+        Official(
+            level="federal",
+            office="US Senator" if office == "s" else "US Representative",
+            name=name,
+            party=party,
+            state=state,
+            district=district,
+            phones=phones,
+            urls=urls,
+            ids=ids,
+        ),
+    )
+
+
+def _current(entries: Tuple[_Entry, ...], today: dt.date) -> List[Official]:
+    return [o for end, o in entries if end is None or end >= today]
+
+
+class Roster:
+    """
+    Immutable index over legislators-current:
+      - senators by state
+      - representatives by (state, district)
+    Term end dates are kept so that terms expiring while the roster is
+    resident drop out without a rebuild.
+    """
+
+    __slots__ = ("senators", "representatives", "etag", "last_modified", "loaded_at")
+
+    def __init__(
+        self,
+        senators: Mapping[str, Tuple[_Entry, ...]],
+        representatives: Mapping[Tuple[str, int], Tuple[_Entry, ...]],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        self.senators = senators
+        self.representatives = representatives
+        self.etag = etag
+        self.last_modified = last_modified
+        self.loaded_at = time.time()
+
+    @classmethod
+    def from_legislators(
+        cls,
+        legislators: List[Dict[str, Any]],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> "Roster":
+        today = dt.date.today()
+        senators: Dict[str, List[_Entry]] = {}
+        reps: Dict[Tuple[str, int], List[_Entry]] = {}
+
+        with metrics.stage("roster_build"):
+            for person in legislators:
+                terms = person.get("terms") or []
+                term = terms[-1] if terms else None
+                if not term:
+                    continue
+
+                end = _parse_end(term)
+                if end is not None and end < today:
+                    continue
+
+                ttype = term.get("type")
+                tstate = term.get("state")
+                if ttype == "sen":
+                    senators.setdefault(tstate, []).append((end, _to_official(person, term)))
+                elif ttype == "rep":
+                    td = int(term.get("district", 0))
+                    reps.setdefault((tstate, td), []).append((end, _to_official(person, term)))
+
+        return cls(
+            {k: tuple(v) for k, v in senators.items()},
+            {k: tuple(v) for k, v in reps.items()},
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    def to_bytes(self) -> bytes:
+        doc = {
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "sen": [[st, [_pack(e) for e in es]] for st, es in self.senators.items()],
+            "rep": [[st, d, [_pack(e) for e in es]] for (st, d), es in self.representatives.items()],
+        }
+        return zlib.compress(json.dumps(doc, separators=(",", ":")).encode())
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> "Roster":
+        doc = json.loads(zlib.decompress(blob))
+        return cls(
+            {st: tuple(_unpack(r) for r in es) for st, es in doc["sen"]},
+            {(st, d): tuple(_unpack(r) for r in es) for st, d, es in doc["rep"]},
+            etag=doc.get("etag"),
+            last_modified=doc.get("last_modified"),
+        )
+
+    def officials_for(self, state: str, district: int) -> List[Official]:
+        """Up to two Senators plus the House member for (state, district)."""
+        return self.officials_for_districts([(state, district)])
+
+    def officials_for_districts(self, districts: Sequence[Tuple[str, int]]) -> List[Official]:
+        """
+        Senators for every state touched, then the House member of each
+        district in the given order (split ZIPs map to several districts).
+        """
+        today = dt.date.today()
+        senators: List[Official] = []
+        reps: List[Official] = []
+        seen_states = set()
+        for state, district in districts:
+            if state not in seen_states:
+                seen_states.add(state)
+                senators += _current(self.senators.get(state, ()), today)[:2]
+            # legislators-current lists one member per seat; keep the last like before
+            reps += _current(self.representatives.get((state, int(district)), ()), today)[-1:]
+        return senators + reps
+
+
+class RosterService:
+    """
+    Keeps a resident Roster, loaded once and refreshed in the background
+    with conditional GETs. A refresh builds a new Roster and swaps the
+    reference, so readers never see a half-built index.
+    """
+
+    def __init__(
+        self,
+        url: str = LEGISLATORS_URL,
+        refresh_seconds: int = ROSTER_REFRESH_SECONDS,
+    ) -> None:
+        self.url = url
+        self.refresh_seconds = refresh_seconds
+        self._roster: Optional[Roster] = None
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._revalidate = False
+
+    async def _fetch(self) -> Optional[Roster]:
+        """GET the roster; returns None when the server answers 304."""
+        headers: Dict[str, str] = {}
+        current = self._roster
+        if current is not None:
+            if current.etag:
+                headers["If-None-Match"] = current.etag
+            if current.last_modified:
+                headers["If-Modified-Since"] = current.last_modified
+
+        async def call() -> Optional[Tuple[Any, httpx.Headers]]:
+            r = await pool.client("legislators").get(self.url, headers=headers)
+            if r.status_code == 304:
+                return None
+            r.raise_for_status()
+            return r.json(), r.headers
+
+        fetched = await guarded("legislators", call)
+        if fetched is None:
+            return None
+        legislators, resp_headers = fetched
+        return Roster.from_legislators(
+            legislators,
+            etag=resp_headers.get("ETag"),
+            last_modified=resp_headers.get("Last-Modified"),
+        )
+
+    async def _load_from_disk(self) -> Optional[Roster]:
+        if disk is None:
+            return None
+        blob = await disk.get_blob("roster")
+        if blob is None:
+            return None
+        try:
+            return Roster.from_bytes(blob)
+        except Exception as e:
+            log.warning("ignoring unreadable cached roster: %s", e)
+            return None
+
+    async def _save_to_disk(self, roster: Roster) -> None:
+        if disk is not None:
+            await disk.put_blob("roster", roster.to_bytes(), ROSTER_DISK_TTL)
+
+    async def refresh(self) -> bool:
+        """Fetch and swap in a new roster. True if the index changed."""
+        async with self._lock:
+            roster = await self._fetch()
+            if roster is None:
+                # 304: still current, so give the disk copy another day
+                if self._roster is not None:
+                    await self._save_to_disk(self._roster)
+                return False
+            self._roster = roster
+            await self._save_to_disk(roster)
+            return True
+
+    async def get(self) -> Roster:
+        """The current roster, loading it on first use (disk cache first)."""
+        roster = self._roster
+        if roster is not None:
+            return roster
+        async with self._lock:
+            if self._roster is None:
+                self._roster = await self._load_from_disk()
+                # may be up to a day old; revalidate (cheaply) right away
+                self._revalidate = self._roster is not None
+            if self._roster is None:
+                self._roster = await self._fetch()
+                if self._roster is not None:
+                    await self._save_to_disk(self._roster)
+        if self._roster is None:
+            raise CivicLookupError("Legislator roster unavailable.")
+        return self._roster
+
+    async def _load_until_ready(self) -> None:
+        """Retry a failed first load with exponential backoff."""
+        delay = ROSTER_RETRY_SECONDS
+        while self._roster is None:
+            await asyncio.sleep(delay)
+            try:
+                await self.get()
+            except Exception as e:
+                delay = min(delay * 2, self.refresh_seconds)
+                log.warning("roster load failed; retrying in %ss: %s", delay, e)
+
+    async def _refresh_loop(self) -> None:
+        await self._load_until_ready()
+        while True:
+            if self._revalidate:
+                self._revalidate = False
+            else:
+                await asyncio.sleep(self.refresh_seconds)
+            try:
+                await self.refresh()
+            except Exception as e:
+                # keep serving the roster we have
+                log.warning("roster refresh failed: %s", e)
+
+    async def start(self) -> None:
+        """
+        Try to load the roster now and keep it fresh in the background. If
+        the first load fails, the background task keeps retrying; lookups
+        meanwhile try to load it themselves.
+        """
+        try:
+            await self.get()
+        except Exception as e:
+            log.warning("roster warm-up failed; retrying in the background: %s", e)
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+roster = RosterService()
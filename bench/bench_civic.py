@@ -0,0 +1,263 @@
+# bench/bench_civic.py
+"""
+Offline benchmark for the free civic provider.
+
+    python -m bench.bench_civic                       # defaults
+    python -m bench.bench_civic --latency 0.05 --concurrency 1,16,64
+    python -m bench.bench_civic --log queries.jsonl --json bench_output.json
+    python -m bench.bench_civic --fail-p95-ms 50      # non-zero exit on regression (cold or warm)
+
+Upstreams are replaced by bench.standin (no network). The load test runs
+get_federal_officials at each concurrency level twice: once cold (empty
+result cache, roster not loaded) and once warm. It reports throughput
+and p50/p95/p99. Micro-benchmarks time the parsing, indexing and lookup
+hot paths on their own.
+
+A query log is JSONL. Each line is a JSON object whose "address", "zip",
+"query" or "q" field is the lookup string, or a bare JSON string. Lines
+without one, or that are not JSON, are skipped. Without a log, a skewed mix of ZIPs and street
+addresses is generated.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import timeit
+from typing import Any, Callable, Dict, List, Optional
+
+from backend.providers import clients, crosswalk, free_civic, resilience, revgeo
+from backend.providers import roster as roster_mod
+from backend.providers.cache import normalize_key
+from backend.providers.models import CivicLookupError
+from bench.standin import SEATS, StandIn, geographies, legislators
+
+QUERY_FIELDS = ("address", "zip", "query", "q")
+
+
+# ----------------------------
+# Workload
+# ----------------------------
+def load_queries(path: str) -> List[str]:
+    out: List[str] = []
+    unreadable = 0
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                unreadable += 1
+                continue
+            if isinstance(rec, str):
+                out.append(rec)
+            elif isinstance(rec, dict):
+                q = next((rec[k] for k in QUERY_FIELDS if rec.get(k)), None)
+                if q:
+                    out.append(str(q))
+    if unreadable:
+        print(f"{path}: skipped {unreadable} line(s) that are not JSON", file=sys.stderr)
+    return out
+
+
+def synthetic_queries(n: int, seed: int = 0) -> List[str]:
+    """~80% ZIPs with a popular head, ~20% street addresses, a few typos."""
+    rng = random.Random(seed)
+    zips = [f"{z:05d}" for z in rng.sample(range(1001, 99950), 2000)]
+    out: List[str] = []
+    for _ in range(n):
+        r = rng.random()
+        if r < 0.8:
+            out.append(zips[min(int(rng.paretovariate(1.2)) - 1, len(zips) - 1)])
+        elif r < 0.98:
+            out.append(f"{rng.randint(1, 9999)} Main St, Springfield {rng.choice(SEATS)[0]}")
+        else:
+            out.append("00000")  # unknown ZIP → error path
+    return out
+
+
+# ----------------------------
+# Harness
+# ----------------------------
+async def install(standin: StandIn, local_data: bool) -> None:
+    """Point the provider at the stand-in and forget every warm structure."""
+    await clients.pool.aclose()
+    clients.pool.transport = standin.transport()
+    free_civic._CACHE.clear()
+    free_civic.disk = None
+    roster_mod.disk = None
+    roster_mod.roster._roster = None
+    for b in resilience.breakers.values():
+        b.record_success()
+        b.release_probe()
+    if not local_data:
+        crosswalk._TABLE, crosswalk._LOADED = None, True
+        revgeo._INDEX, revgeo._LOADED = None, True
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    i = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[i]
+
+
+async def run_load(queries: List[str], concurrency: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors = 0
+    it = iter(queries)
+
+    async def worker() -> None:
+        nonlocal errors
+        for q in it:
+            t0 = time.perf_counter()
+            try:
+                await free_civic.get_federal_officials(q)
+            except CivicLookupError:
+                errors += 1
+            latencies.append(time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - t0
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / wall if wall else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+async def load_test(
+    queries: List[str], levels: List[int], standin: StandIn, local_data: bool
+) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    for c in levels:
+        await install(standin, local_data)
+        for phase in ("cold", "warm"):
+            standin.calls.clear()
+            row = await run_load(queries, c)
+            row["phase"] = phase
+            row["upstream_calls"] = sum(standin.calls.values())
+            rows.append(row)
+    await clients.pool.aclose()
+    return rows
+
+
+# ----------------------------
+# Micro-benchmarks
+# ----------------------------
+def _time(fn: Callable[[], Any], min_time: float = 0.2) -> float:
+    """Best-of-5 seconds per call."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def micro() -> List[Dict[str, Any]]:
+    people = legislators()
+    payload = json.dumps(people)
+    geo = geographies(12345)
+    roster = roster_mod.Roster.from_legislators(people)
+    table = crosswalk.ZipCrosswalk(memoryview(crosswalk.build([
+        (f"{z:05d}", SEATS[z % len(SEATS)][0], z % 9, None) for z in range(1000, 41000)
+    ])))
+    squares = {"features": [
+        {"properties": {"STATEFP": "39", "CD119FP": f"{(i * 10 + j) % 15 + 1:02d}"},
+         "geometry": {"type": "Polygon", "coordinates": [[
+             [x, y], [x + 1, y], [x + 1, y + 1], [x, y + 1], [x, y]
+         ] for x, y in [(-100 + i, 30 + j)]]}}
+        for i in range(20) for j in range(10)
+    ]}
+    districts = revgeo.DistrictIndex.from_geojson(squares)
+    rng = random.Random(1)
+    lats = [rng.uniform(30, 40) for _ in range(10_000)]
+    lons = [rng.uniform(-100, -80) for _ in range(10_000)]
+
+    cases: List[tuple] = [
+        ("legislators json.loads", lambda: json.loads(payload)),
+        ("Roster.from_legislators", lambda: roster_mod.Roster.from_legislators(people)),
+        ("Roster.officials_for", lambda: roster.officials_for("OH", 3)),
+        ("_extract_state_and_cd", lambda: free_civic._extract_state_and_cd(geo)),
+        ("normalize_key", lambda: normalize_key("  123 Main St. ,Springfield,  OH ")),
+        ("ZipCrosswalk.lookup", lambda: table.lookup("20123")),
+        ("DistrictIndex.locate", lambda: districts.locate(35.5, -90.5)),
+        ("DistrictIndex.locate_many x10k", lambda: districts.locate_many(lats, lons)),
+    ]
+    return [{"name": name, "us": _time(fn) * 1e6} for name, fn in cases]
+
+
+# ----------------------------
+# CLI
+# ----------------------------
+def _print_load(rows: List[Dict[str, Any]]) -> None:
+    print(f"{'phase':<5} {'conc':>5} {'reqs':>6} {'err':>4} {'req/s':>9} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'upstream':>9}")
+    for r in rows:
+        print(f"{r['phase']:<5} {r['concurrency']:>5} {r['requests']:>6} {r['errors']:>4} "
+              f"{r['rps']:>9.1f} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} "
+              f"{r['upstream_calls']:>9}")
+
+
+def _print_micro(rows: List[Dict[str, Any]]) -> None:
+    for r in rows:
+        print(f"{r['name']:<32} {r['us']:>12.2f} us")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--log", help="JSONL query log to replay")
+    ap.add_argument("--requests", type=int, default=300, help="synthetic queries when no --log")
+    ap.add_argument("--concurrency", default="1,16,64")
+    ap.add_argument("--latency", type=float, default=0.02, help="injected upstream latency (s)")
+    ap.add_argument("--jitter", type=float, default=0.005)
+    ap.add_argument("--fixtures", help="directory of recorded upstream responses")
+    ap.add_argument("--local-data", action="store_true",
+                    help="keep an installed ZIP crosswalk / district boundaries in play")
+    ap.add_argument("--skip-load", action="store_true")
+    ap.add_argument("--skip-micro", action="store_true")
+    ap.add_argument("--json", help="also write results to this file")
+    ap.add_argument("--fail-p95-ms", type=float,
+                    help="exit 1 if any cold or warm p95 exceeds this many milliseconds")
+    args = ap.parse_args(argv)
+
+    report: Dict[str, Any] = {}
+    if not args.skip_micro:
+        report["micro"] = micro()
+        _print_micro(report["micro"])
+    if not args.skip_load:
+        queries = load_queries(args.log) if args.log else synthetic_queries(args.requests)
+        if not queries:
+            ap.error(f"no queries in {args.log}: expected JSON strings or objects "
+                     f"with one of {', '.join(QUERY_FIELDS)}")
+        levels = [int(c) for c in args.concurrency.split(",") if c]
+        standin = StandIn(args.latency, args.jitter, args.fixtures)
+        report["load"] = asyncio.run(load_test(queries, levels, standin, args.local_data))
+        if "micro" in report:
+            print()
+        _print_load(report["load"])
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.fail_p95_ms is not None:
+        slow = [r for r in report.get("load", []) if r["p95_ms"] > args.fail_p95_ms]
+        if slow:
+            where = ", ".join(f"{r['phase']} c={r['concurrency']}" for r in slow)
+            print(f"p95 above {args.fail_p95_ms} ms ({where})", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
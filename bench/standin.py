@@ -0,0 +1,177 @@
+# bench/standin.py
+"""
+Local stand-ins for the free upstreams, served through httpx.MockTransport.
+
+Payloads follow the shapes of the live APIs (Zippopotam places, Census
+geographies / addressMatches / batch CSV, congress-legislators persons).
+They are generated deterministically, so no network access or data
+files are needed. To replay recorded responses instead, pass a directory
+holding any of:
+    legislators-current.json
+    zippopotam/<zip>.json
+    census-coordinates.json   (one response, served for every point)
+    census-onelineaddress.json
+Every response is delayed by `latency` seconds ± `jitter`.
+"""
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import json
+import os
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+# (state, number of House seats; 0 = at-large)
+SEATS: List[Tuple[str, int]] = [
+    ("AL", 7), ("AK", 0), ("AZ", 9), ("AR", 4), ("CA", 52), ("CO", 8), ("CT", 5),
+    ("DE", 0), ("FL", 28), ("GA", 14), ("HI", 2), ("ID", 2), ("IL", 17), ("IN", 9),
+    ("IA", 4), ("KS", 4), ("KY", 6), ("LA", 6), ("ME", 2), ("MD", 8), ("MA", 9),
+    ("MI", 13), ("MN", 8), ("MS", 4), ("MO", 8), ("MT", 2), ("NE", 3), ("NV", 4),
+    ("NH", 2), ("NJ", 12), ("NM", 3), ("NY", 26), ("NC", 14), ("ND", 0), ("OH", 15),
+    ("OK", 5), ("OR", 6), ("PA", 17), ("RI", 2), ("SC", 7), ("SD", 0), ("TN", 9),
+    ("TX", 38), ("UT", 4), ("VT", 0), ("VA", 11), ("WA", 10), ("WV", 2), ("WI", 8),
+    ("WY", 0),
+]
+
+
+def district_for(key: int) -> Tuple[str, int]:
+    """Deterministic (state, district) for any integer key."""
+    state, seats = SEATS[key % len(SEATS)]
+    return state, (key // len(SEATS)) % seats + 1 if seats else 0
+
+
+def legislators() -> List[Dict[str, Any]]:
+    """A full-size roster: 100 senators, 435 current House members, plus retirees."""
+    people: List[Dict[str, Any]] = []
+    n = 0
+
+    def person(term: Dict[str, Any], end: str = "2099-01-03") -> None:
+        nonlocal n
+        n += 1
+        old = dict(term, start="2019-01-03", end="2021-01-03")
+        people.append({
+            "id": {"bioguide": f"B{n:06d}", "govtrack": n},
+            "name": {"first": f"First{n}", "middle": "Q", "last": f"Last{n}"},
+            "terms": [old, dict(term, start="2025-01-03", end=end)],
+        })
+
+    for state, seats in SEATS:
+        for _ in range(2):
+            person({"type": "sen", "state": state, "party": "Independent",
+                    "phone": "202-224-0000", "url": "https://www.senate.gov"})
+        for d in range(1, seats + 1) if seats else [0]:
+            person({"type": "rep", "state": state, "district": d, "party": "Independent",
+                    "phone": "202-225-0000", "url": "https://www.house.gov"})
+        # someone whose term is over, to keep the date filter honest
+        person({"type": "rep", "state": state, "district": 1}, end="2023-01-03")
+    return people
+
+
+def zippopotam(zip_code: str) -> Dict[str, Any]:
+    z = int(zip_code)
+    lat = 25 + (z % 2300) / 100
+    lon = -124 + (z % 5700) / 100
+    return {
+        "post code": zip_code,
+        "country": "United States",
+        "places": [{"place name": f"Town {zip_code}", "latitude": f"{lat:.4f}",
+                    "longitude": f"{lon:.4f}", "state abbreviation": district_for(z)[0]}],
+    }
+
+
+def geographies(key: int, padding: int = 30) -> Dict[str, Any]:
+    """A layers=all sized payload: the two layers we read plus `padding` we don't."""
+    state, district = district_for(key)
+    geo: Dict[str, Any] = {
+        f"Layer {i}": [{"GEOID": str(key), "NAME": f"Thing {i}", "OID": i, "AREALAND": 1}]
+        for i in range(padding)
+    }
+    geo["States"] = [{"STUSAB": state, "GEOID": "00", "NAME": state}]
+    geo["119th Congressional Districts"] = [
+        {"BASENAME": "At Large" if district == 0 else str(district), "CD119": f"{district:02d}"}
+    ]
+    return geo
+
+
+def _key_from_coords(params: httpx.QueryParams) -> int:
+    lat = float(params.get("y", 0))
+    lon = float(params.get("x", 0))
+    return abs(int(lat * 1000) * 31 + int(lon * 1000))
+
+
+class StandIn:
+    """Routes requests for every upstream URL the provider uses."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        fixtures: Optional[str] = None,
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.fixtures = fixtures
+        self.rng = random.Random(seed)
+        self.calls: Dict[str, int] = {}
+        self._legislators = json.dumps(self._fixture("legislators-current.json") or legislators())
+
+    def _fixture(self, name: str) -> Optional[Any]:
+        if not self.fixtures:
+            return None
+        path = os.path.join(self.fixtures, name)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        self.calls[host] = self.calls.get(host, 0) + 1
+        delay = self.latency + self.rng.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        path = request.url.path
+
+        if host == "unitedstates.github.io":
+            return httpx.Response(200, text=self._legislators, headers={"ETag": '"standin"'})
+        if host == "api.zippopotam.us":
+            zip_code = path.rsplit("/", 1)[-1]
+            body = self._fixture(f"zippopotam/{zip_code}.json")
+            if body is None and not zip_code.startswith("000"):
+                body = zippopotam(zip_code)
+            return httpx.Response(200, json=body) if body else httpx.Response(404, json={})
+        if path.endswith("/coordinates"):
+            body = self._fixture("census-coordinates.json")
+            return httpx.Response(200, json=body or {
+                "result": {"input": {}, "geographies": geographies(_key_from_coords(request.url.params))}
+            })
+        if path.endswith("/onelineaddress"):
+            body = self._fixture("census-onelineaddress.json")
+            address = request.url.params.get("address", "")
+            if body is None:
+                key = sum(map(ord, address))
+                body = {"result": {"input": {}, "addressMatches": [
+                    {"matchedAddress": address.upper(), "coordinates": {"x": -84.5, "y": 39.1},
+                     "geographies": geographies(key)}
+                ]}}
+            return httpx.Response(200, json=body)
+        if path.endswith("/addressbatch"):
+            out = io.StringIO()
+            w = csv.writer(out, quoting=csv.QUOTE_ALL)
+            upload = request.content.decode("latin-1")
+            for rec in csv.reader(io.StringIO(upload)):
+                if rec and rec[0].isdigit():
+                    key = sum(map(ord, rec[1]))
+                    lat, lon = 25 + (key % 2300) / 100, -124 + (key % 5700) / 100
+                    w.writerow([rec[0], rec[1], "Match", "Exact", rec[1].upper(),
+                                f"{lon},{lat}", "1", "L", "39", "061", "000100", "1000"])
+            return httpx.Response(200, text=out.getvalue())
+        return httpx.Response(404)
@@ -0,0 +1,77 @@
+# tests/test_batch.py
+import asyncio
+import io
+
+import httpx
+import pytest
+
+from backend.providers import clients, free_civic, resilience, revgeo
+from backend.providers.batch import parse_rows
+
+GEOGRAPHIES = {
+    "States": [{"STUSAB": "OH"}],
+    "119th Congressional Districts": [{"BASENAME": "1"}],
+}
+
+
+@pytest.fixture
+def census(monkeypatch):
+    """Route the census client to `handler`; no local boundaries or disk cache."""
+    monkeypatch.setattr(revgeo, "_INDEX", None)
+    monkeypatch.setattr(revgeo, "_LOADED", True)
+    monkeypatch.setattr(free_civic, "disk", None)
+    for name in ("census", "census_batch"):
+        monkeypatch.setitem(resilience.breakers, name, resilience.CircuitBreaker(name))
+
+    def install(handler):
+        monkeypatch.setattr(clients.pool, "transport", httpx.MockTransport(handler))
+
+    yield install
+    asyncio.run(clients.pool.aclose())
+
+
+def test_failed_retry_benchmark_keeps_earlier_matches(census):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/addressbatch"):
+            if b"Public_AR_Census2020" in request.content:
+                return httpx.Response(503)
+            rows = [line.split(",")[0] for line in request.content.decode().splitlines()
+                    if line[:1].isdigit() and "Main" in line]
+            return httpx.Response(200, text="\n".join(
+                f'"{i}","x","Match","Exact","x","-84.5,39.1"' for i in rows
+            ))
+        return httpx.Response(200, json={"result": {"geographies": GEOGRAPHIES}})
+
+    census(handler)
+    rows = [{"id": "a", "address": "1 Main St"}, {"id": "b", "address": "2 Nowhere Rd"}]
+    out = asyncio.run(free_civic._batch_geocode(rows, asyncio.Semaphore(4)))
+    assert out[0] == [("OH", 1)]
+    assert isinstance(out[1], free_civic.CivicLookupError)
+    assert "503" in str(out[1])
+
+
+def _parse(data: bytes, fmt: str):
+    async def collect():
+        return [r async for r in parse_rows(io.BytesIO(data), fmt)]
+
+    return asyncio.run(collect())
+
+
+def test_csv_quoted_newline_stays_in_one_row():
+    rows = _parse(
+        b'id,street,city,state,zip\r\n1,"100 Main St\nApt 4",Cincinnati,OH,45220\r\n\r\n2,,,,45220\r\n',
+        "csv",
+    )
+    assert [r["id"] for r in rows] == ["1", "2"]
+    assert rows[0]["street"] == "100 Main St\nApt 4"
+    assert rows[0]["address"] == "100 Main St\nApt 4, Cincinnati, OH, 45220"
+    assert rows[1]["address"] == "45220"
+
+
+def test_jsonl_bad_records_become_error_rows():
+    rows = _parse(b'"1 Main St"\n{bad\n42\n\n{"id": "x", "zip": "45220"}\n', "jsonl")
+    assert [r["id"] for r in rows] == ["1", "2", "3", "x"]
+    assert rows[0]["address"] == "1 Main St"
+    assert rows[1]["error"].startswith("Unreadable row")
+    assert "int" in rows[2]["error"]
+    assert rows[3]["address"] == "45220"
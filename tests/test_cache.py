@@ -0,0 +1,136 @@
+# tests/test_cache.py
+import asyncio
+import types
+
+import pytest
+
+from backend.providers import cache
+from backend.providers.cache import LookupCache, normalize_key
+from backend.providers.models import CivicLookupError, UpstreamUnavailable
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock for the cache only (the event loop keeps the real one)."""
+    now = [1000.0]
+    monkeypatch.setattr(cache, "time", types.SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+class Loader:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        result = self.results[min(self.calls, len(self.results)) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def _cache(**kw) -> LookupCache:
+    return LookupCache(**{"maxsize": 4, "ttl": 10, "stale_ttl": 5, "negative_ttl": 2, **kw})
+
+
+def test_concurrent_misses_share_one_load(clock):
+    c, load = _cache(), Loader("v")
+
+    async def run():
+        return await asyncio.gather(*(c.get_or_load("k", load) for _ in range(10)))
+
+    assert asyncio.run(run()) == ["v"] * 10
+    assert load.calls == 1
+    assert c.stats()["coalesced"] == 9
+    assert c.stats()["inflight"] == 0
+
+
+def test_stale_entry_is_served_while_one_refresh_runs(clock):
+    c, load = _cache(), Loader("old", "new")
+
+    async def run():
+        assert await c.get_or_load("k", load) == "old"
+        clock[0] += 12  # past ttl, inside stale_ttl
+        assert await c.get_or_load("k", load) == "old"
+        assert await c.get_or_load("k", load) == "old"  # refresh already running
+        await asyncio.sleep(0.01)
+        assert await c.get_or_load("k", load) == "new"
+
+    asyncio.run(run())
+    assert load.calls == 2
+    assert c.stale_hits == 2
+
+
+def test_not_found_is_remembered_for_negative_ttl(clock):
+    c, load = _cache(), Loader(CivicLookupError("nope"), "found")
+
+    async def run():
+        for _ in range(2):
+            with pytest.raises(CivicLookupError, match="nope"):
+                await c.get_or_load("k", load)
+        assert load.calls == 1
+        clock[0] += 3
+        assert await c.get_or_load("k", load) == "found"
+
+    asyncio.run(run())
+    assert c.negative_hits == 1
+
+
+def test_upstream_outage_is_never_cached(clock):
+    c, load = _cache(), Loader(UpstreamUnavailable("down"), "v")
+
+    async def run():
+        with pytest.raises(UpstreamUnavailable):
+            await c.get_or_load("k", load)
+        assert await c.get_or_load("k", load) == "v"
+
+    asyncio.run(run())
+    assert load.calls == 2
+
+
+def test_expired_answer_is_served_during_an_outage(clock):
+    c, load = _cache(), Loader("v", UpstreamUnavailable("down"), "v2")
+
+    async def run():
+        assert await c.get_or_load("k", load) == "v"
+        clock[0] += 100  # past ttl + stale_ttl
+        assert await c.get_or_load("k", load) == "v"
+        assert await c.get_or_load("k", load) == "v2"  # outage over
+
+    asyncio.run(run())
+    assert load.calls == 3
+
+
+def test_expired_answer_survives_repeated_outages(clock):
+    c, load = _cache(), Loader("v", UpstreamUnavailable("down"))
+
+    async def run():
+        await c.get_or_load("k", load)
+        clock[0] += 100
+        for _ in range(3):
+            assert await c.get_or_load("k", load) == "v"
+
+    asyncio.run(run())
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    c = _cache(maxsize=2)
+
+    async def run():
+        for k in ("a", "b"):
+            await c.get_or_load(k, Loader(k))
+        await c.get_or_load("a", Loader("unused"))  # touch a
+        await c.get_or_load("c", Loader("c"))
+        load = Loader("b again")
+        assert await c.get_or_load("b", load) == "b again"
+        assert load.calls == 1
+
+    asyncio.run(run())
+    assert c.evictions == 2
+
+
+def test_normalize_key():
+    assert normalize_key("  123 Main St. ,Springfield,  OH ") == "123 main st, springfield, oh"
+    assert normalize_key("45220") == "45220"
@@ -0,0 +1,59 @@
+# tests/test_crosswalk.py
+import pytest
+
+from backend.providers.crosswalk import ZipCrosswalk, build, read_csv
+
+
+@pytest.fixture
+def table(tmp_path):
+    src = tmp_path / "zccd.csv"
+    src.write_text(
+        "state_fips,state_abbr,zcta,cd,share\n"
+        "39,OH,45220,1,0.3\n"
+        "39,OH,45220,2,0.7\n"
+        "11,DC,20001,98,\n"
+        "25,MA,2134,7,\n"
+        "02,AK,99501,0,\n"
+        "99,XX,12345,1,\n"
+        "39,OH,4522a,1,\n"
+    )
+    dst = tmp_path / "zip_cd.bin"
+    dst.write_bytes(build(read_csv(str(src))))
+    return ZipCrosswalk.open(str(dst))
+
+
+def test_split_zip_lists_every_district_largest_share_first(table):
+    (s1, d1, share1), (s2, d2, share2) = table.lookup("45220")
+    assert (s1, d1, s2, d2) == ("OH", 2, "OH", 1)
+    assert share1 == pytest.approx(0.7, abs=1e-4)
+    assert share2 == pytest.approx(0.3, abs=1e-4)
+
+
+def test_delegate_and_at_large_seats_are_district_zero(table):
+    assert table.lookup("20001") == [("DC", 0, 1.0)]
+    assert table.lookup("99501") == [("AK", 0, 1.0)]
+
+
+def test_zips_keep_leading_zeros(table):
+    assert table.lookup("02134") == [("MA", 7, 1.0)]
+    assert "02134" in table
+
+
+def test_unknown_and_malformed_zips(table):
+    assert table.lookup("12345") == []  # only row had an unknown state
+    assert table.lookup("00000") == []
+    assert table.lookup("99999") == []
+    for bad in ("4522a", "4522", "452200", "", " 45220"):
+        assert table.lookup(bad) == []
+    assert len(table) == 4
+
+
+def test_equal_shares_without_a_share_column():
+    t = ZipCrosswalk(memoryview(build([("10001", "NY", 10, None), ("10001", "NY", 12, None)])))
+    assert sorted((s, d) for s, d, _ in t.lookup("10001")) == [("NY", 10), ("NY", 12)]
+    assert [share for _, _, share in t.lookup("10001")] == pytest.approx([0.5, 0.5], abs=1e-4)
+
+
+def test_rejects_other_files():
+    with pytest.raises(ValueError):
+        ZipCrosswalk(memoryview(b"NOPE" + bytes(8)))
@@ -0,0 +1,37 @@
+# tests/test_main.py
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.providers.roster import Roster, roster
+
+LEGISLATORS = [
+    {"name": {"official_full": "Sen A"}, "terms": [{"type": "sen", "state": "OH", "end": "2099-01-03"}]},
+    {"name": {"official_full": "Rep B"},
+     "terms": [{"type": "rep", "state": "OH", "district": 1, "end": "2099-01-03", "phone": "555"}]},
+]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(roster, "_roster", Roster.from_legislators(LEGISLATORS))
+    return TestClient(app)  # no lifespan: nothing reaches the network
+
+
+def test_officials_by_state_and_district(client):
+    r = client.get("/officials", params={"state": "oh", "district": 1})
+    assert r.status_code == 200
+    body = r.json()
+    assert body["location"] == {"zip": None, "state": "OH", "district": 1, "districts": [1]}
+    assert [o["name"] for o in body["officials"]["senators"]] == ["Sen A"]
+    assert body["officials"]["representative"]["phone"] == "555"
+
+
+def test_seat_without_a_representative_is_not_found(client):
+    assert client.get("/officials", params={"state": "OH", "district": 99}).status_code == 404
+
+
+def test_bad_parameters_are_rejected(client):
+    assert client.get("/officials").status_code == 422
+    assert client.get("/officials", params={"zip": "4522"}).status_code == 422
+    assert client.get("/revgeo", params={"lat": 95, "lon": 0}).status_code == 422
@@ -0,0 +1,81 @@
+# tests/test_resilience.py
+import asyncio
+
+import httpx
+import pytest
+
+from backend.providers import resilience
+from backend.providers.models import UpstreamUnavailable
+from backend.providers.resilience import CircuitBreaker, guarded
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    b = CircuitBreaker("test", threshold=1, cooldown=0)
+    monkeypatch.setitem(resilience.breakers, "test", b)
+    monkeypatch.setitem(resilience.DEADLINES, "test", 1.0)
+    return b
+
+
+def _half_open(b: CircuitBreaker) -> None:
+    b.record_failure()
+    assert b.state == "half-open"
+
+
+async def _bad_json() -> dict:
+    return httpx.Response(200, text="<html>maintenance</html>").json()
+
+
+async def _ok() -> str:
+    return "ok"
+
+
+def test_unusable_body_on_probe_reopens_breaker(breaker):
+    _half_open(breaker)
+    with pytest.raises(UpstreamUnavailable):
+        asyncio.run(guarded("test", _bad_json))
+    assert not breaker._probing
+    assert breaker.failures == 2
+
+    # cooldown is 0, so the next call is a fresh probe rather than a stuck one
+    assert asyncio.run(guarded("test", _ok)) == "ok"
+    assert breaker.state == "closed"
+
+
+def test_cancelled_probe_frees_the_slot(breaker):
+    _half_open(breaker)
+
+    async def cancelled() -> None:
+        task = asyncio.ensure_future(guarded("test", lambda: asyncio.sleep(10)))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancelled())
+    assert not breaker._probing
+    assert breaker.allow() == (True, True)
+
+
+def test_request_budget_timeout_is_not_an_upstream_failure(breaker):
+    async def run() -> None:
+        with resilience.request_budget(0.01):
+            await guarded("test", lambda: asyncio.sleep(1))
+
+    with pytest.raises(UpstreamUnavailable):
+        asyncio.run(run())
+    assert breaker.failures == 0
+    assert breaker.state == "closed"
+
+
+def test_only_the_probe_releases_the_probe_slot(breaker):
+    async def run() -> None:
+        # admitted while closed, still running when the breaker opens
+        slow = asyncio.ensure_future(guarded("test", lambda: asyncio.sleep(0.05)))
+        await asyncio.sleep(0)
+        _half_open(breaker)
+        assert breaker.allow() == (True, True)  # someone else's probe, in flight
+        await slow
+        assert breaker._probing  # still held by the probe, not cleared by `slow`
+
+    asyncio.run(run())
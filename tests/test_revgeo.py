@@ -0,0 +1,65 @@
+# tests/test_revgeo.py
+import random
+
+import pytest
+
+from backend.providers.revgeo import DistrictIndex
+
+
+def _square(x0, y0, x1, y1):
+    return [[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]
+
+
+def _feature(statefp, cd, geometry):
+    return {"type": "Feature", "properties": {"STATEFP": statefp, "CD119FP": cd}, "geometry": geometry}
+
+
+FIXTURE = {"type": "FeatureCollection", "features": [
+    # OH-1 with a hole; OH-2 is an island inside that hole
+    _feature("39", "01", {"type": "Polygon", "coordinates": [
+        _square(-85, 39, -84, 40), _square(-84.6, 39.4, -84.4, 39.6),
+    ]}),
+    _feature("39", "02", {"type": "Polygon", "coordinates": [_square(-84.55, 39.45, -84.45, 39.55)]}),
+    # AK at-large as two far-apart parts
+    _feature("02", "00", {"type": "MultiPolygon", "coordinates": [
+        [_square(-150, 60, -149, 61)], [_square(-160, 55, -159, 56)],
+    ]}),
+    _feature("11", "98", {"type": "Polygon", "coordinates": [_square(-77.1, 38.8, -76.9, 39.0)]}),
+    _feature("39", "ZZ", {"type": "Polygon", "coordinates": [_square(-83, 41, -82, 42)]}),
+]}
+
+
+@pytest.fixture
+def idx():
+    return DistrictIndex.from_geojson(FIXTURE, cell=0.5)
+
+
+def test_holes_exclude_and_islands_inside_them_resolve(idx):
+    assert idx.locate(39.2, -84.8) == ("OH", 1)
+    assert idx.locate(39.42, -84.58) is None  # in the hole, outside the island
+    assert idx.locate(39.5, -84.5) == ("OH", 2)
+
+
+def test_multipolygon_parts_and_seat_numbers(idx):
+    assert idx.locate(60.5, -149.5) == ("AK", 0)
+    assert idx.locate(55.5, -159.5) == ("AK", 0)
+    assert idx.locate(58.0, -155.0) is None  # between the parts
+    assert idx.locate(38.9, -77.0) == ("DC", 0)  # delegate (98)
+    assert idx.locate(41.5, -82.5) is None  # ZZ features are skipped
+
+
+def test_points_on_grid_cell_edges(idx):
+    # cell is 0.5°: these sit exactly on cell boundaries inside OH-1
+    for lat, lon in [(39.0 + 1e-9, -84.5), (39.5, -84.75), (39.5, -84.25), (39.25, -84.5)]:
+        assert idx.locate(lat, lon) == ("OH", 1), (lat, lon)
+    assert idx.locate(40.5, -84.5) is None
+
+
+def test_locate_many_agrees_with_locate(idx):
+    rng = random.Random(7)
+    lats = [rng.uniform(38.5, 40.5) for _ in range(2000)] + [60.5, 55.5, 38.9, 0.0]
+    lons = [rng.uniform(-85.5, -83.5) for _ in range(2000)] + [-149.5, -159.5, -77.0, 0.0]
+    many = idx.locate_many(lats, lons)
+    assert many == [idx.locate(la, lo) for la, lo in zip(lats, lons)]
+    assert {("OH", 1), ("OH", 2), None} <= set(many)
+    assert idx.locate_many([], []) == []
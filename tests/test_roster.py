@@ -0,0 +1,76 @@
+# tests/test_roster.py
+import asyncio
+
+import httpx
+
+from backend.providers import clients, resilience
+from backend.providers import roster as roster_mod
+from backend.providers.roster import RosterService
+
+LEGISLATORS = [
+    {"name": {"official_full": "A"}, "terms": [{"type": "sen", "state": "OH", "end": "2099-01-03"}]},
+]
+
+
+def test_failed_warm_up_still_starts_the_refresher(monkeypatch):
+    up = {"ok": False}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=LEGISLATORS) if up["ok"] else httpx.Response(503)
+
+    monkeypatch.setattr(clients.pool, "transport", httpx.MockTransport(handler))
+    monkeypatch.setattr(roster_mod, "disk", None)
+    monkeypatch.setattr(roster_mod, "ROSTER_RETRY_SECONDS", 0.01)
+    monkeypatch.setitem(resilience.breakers, "legislators", resilience.CircuitBreaker("legislators"))
+
+    async def run() -> None:
+        service = RosterService(refresh_seconds=3600)
+        await service.start()  # upstream down: must not raise
+        assert service._task is not None
+        up["ok"] = True
+        for _ in range(100):
+            if service._roster is not None:
+                break
+            await asyncio.sleep(0.01)
+        try:
+            assert service._roster is not None
+            assert [o.name for o in service._roster.officials_for("OH", 1)] == ["A"]
+        finally:
+            await service.stop()
+            await clients.pool.aclose()
+
+    asyncio.run(run())
+
+
+class _Disk:
+    def __init__(self):
+        self.puts = []
+
+    async def get_blob(self, name):
+        return None
+
+    async def put_blob(self, name, value, ttl):
+        self.puts.append((name, ttl))
+
+
+def test_not_modified_extends_the_disk_copy(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=LEGISLATORS, headers={"ETag": '"v1"'})
+
+    disk = _Disk()
+    monkeypatch.setattr(clients.pool, "transport", httpx.MockTransport(handler))
+    monkeypatch.setattr(roster_mod, "disk", disk)
+    monkeypatch.setitem(resilience.breakers, "legislators", resilience.CircuitBreaker("legislators"))
+
+    async def run() -> None:
+        service = RosterService()
+        try:
+            await service.get()
+            assert await service.refresh() is False
+        finally:
+            await clients.pool.aclose()
+
+    asyncio.run(run())
+    assert disk.puts == [("roster", roster_mod.ROSTER_DISK_TTL)] * 2